@@ -0,0 +1,57 @@
+"""
+Tests for AnimationHelper
+"""
+import os
+import unittest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import Qt, QTimer, QEventLoop
+from PySide6.QtWidgets import QApplication, QGraphicsOpacityEffect, QWidget
+
+from transcription_app.gui.styles.animation_helper import AnimationHelper
+
+
+def _spin(ms: int):
+    """Run the event loop for a while so animations can finish"""
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+class SmoothShowTest(unittest.TestCase):
+    """smooth_show must leave the widget opaque even when it skips animating"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.window = QWidget()
+        self.window.resize(200, 200)
+        self.child = QWidget(self.window)
+        self.window.show()
+        _spin(50)
+
+    def tearDown(self):
+        self.window.close()
+        self.window.deleteLater()
+
+    def test_skipped_show_after_animated_hide_restores_opacity(self):
+        AnimationHelper.smooth_hide(self.child, duration=50)
+        _spin(300)
+        effect = self.child.graphicsEffect()
+        self.assertIsInstance(effect, QGraphicsOpacityEffect)
+        self.assertFalse(self.child.isVisible())
+        self.assertEqual(effect.opacity(), 0.0)
+
+        # Minimized window: the show is not animated
+        self.window.setWindowState(Qt.WindowState.WindowMinimized)
+        AnimationHelper.smooth_show(self.child)
+
+        self.assertTrue(self.child.isVisible())
+        self.assertEqual(self.child.graphicsEffect().opacity(), 1.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
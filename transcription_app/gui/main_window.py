@@ -8,7 +8,7 @@ from PySide6.QtWidgets import (
     QListWidget, QFileDialog, QListWidgetItem, QProgressBar, QMessageBox,
     QComboBox, QLabel
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, QTimer
 from PySide6.QtGui import QFont, QAction, QKeySequence
 
 from transcription_app.gui.widgets.drop_zone_widget import DropZoneWidget
@@ -17,7 +17,7 @@ from transcription_app.gui.widgets.file_queue_widget import FileQueueWidget
 from transcription_app.gui.widgets.settings_dialog import SettingsDialog
 from transcription_app.gui.widgets.transcript_widget import TranscriptWidget
 from transcription_app.gui.styles import StyleSheetManager, Theme, get_icon_manager, AnimationHelper
-from transcription_app.gui.styles.stylesheet_manager import SPACING
+from transcription_app.gui.styles.stylesheet_manager import SPACING_PX
 from transcription_app.core.transcript_exporter import TranscriptExporter
 from transcription_app.utils.logger import get_logger
 
@@ -27,6 +27,9 @@ logger = get_logger(__name__)
 class MainWindow(QMainWindow):
     """Main application window"""
 
+    # Icons the window's buttons use (all at button size, default color)
+    _BUTTON_ICONS = ('folder-open', 'text', 'subtitle', 'clear', 'settings')
+
     def __init__(self, viewmodel, config):
         super().__init__()
         self.viewmodel = viewmodel
@@ -34,6 +37,7 @@ class MainWindow(QMainWindow):
         self.file_items = {}  # Maps file_id to QListWidgetItem
         self.file_progress = {}  # Maps file_id to QProgressBar
         self.current_result = None  # Store current transcription result
+        self._icons_warmed = False  # Icon cache warm-up scheduled on first show
 
         # Initialize theme based on config
         initial_theme = Theme.DARK if config.theme == "dark" else Theme.LIGHT
@@ -61,12 +65,12 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(central)
         main_layout = QVBoxLayout(central)
         # Compact spacing using design tokens
-        main_layout.setSpacing(int(SPACING['md'].replace('px', '')))  # 8px
+        main_layout.setSpacing(SPACING_PX['md'])  # 8px
         main_layout.setContentsMargins(
-            int(SPACING['base'].replace('px', '')),
-            int(SPACING['md'].replace('px', '')),
-            int(SPACING['base'].replace('px', '')),
-            int(SPACING['md'].replace('px', ''))
+            SPACING_PX['base'],
+            SPACING_PX['md'],
+            SPACING_PX['base'],
+            SPACING_PX['md']
         )  # 12px sides, 8px top/bottom
 
         # Command bar
@@ -202,7 +206,7 @@ class MainWindow(QMainWindow):
         self.dark_mode_action = QAction("&Dark Mode", self)
         self.dark_mode_action.setCheckable(True)
         # Set initial state based on current theme
-        self.dark_mode_action.setChecked(self.style_manager.current_theme == Theme.DARK)
+        self.dark_mode_action.setChecked(self.style_manager.current_theme is Theme.DARK)
         self.dark_mode_action.setShortcut(QKeySequence("Ctrl+D"))
         self.dark_mode_action.setStatusTip("Toggle between dark and light theme")
         self.dark_mode_action.triggered.connect(self.toggle_dark_mode)
@@ -229,7 +233,7 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         layout = QHBoxLayout(widget)
         # Compact spacing between buttons (4px)
-        layout.setSpacing(int(SPACING['sm'].replace('px', '')))
+        layout.setSpacing(SPACING_PX['sm'])
         layout.setContentsMargins(0, 0, 0, 0)
 
         btn_open = QPushButton(self.icon_manager.get_button_icon('folder-open'), " Open Files")
@@ -368,15 +372,10 @@ class MainWindow(QMainWindow):
     @Slot(list)
     def on_files_added(self, files):
         """Handle files added to queue"""
-        for file_path in files:
-            file_id = Path(file_path).name
-
-            # Add to enhanced queue widget
-            self.file_queue.add_file(file_id, file_path)
+        # Add to enhanced queue widget in one batch
+        self.file_queue.add_files((Path(file_path).name, file_path) for file_path in files)
 
-            # Auto-start transcription is now handled by the ViewModel queue
-            # logger.info(f"Starting transcription for: {file_id}")
-            # self.viewmodel.start_transcription(file_path)
+        # Auto-start transcription is now handled by the ViewModel queue
 
         self.status_bar.showMessage(f"Added {len(files)} file(s) to queue")
 
@@ -670,6 +669,10 @@ class MainWindow(QMainWindow):
         Args:
             theme: Theme to apply
         """
+        # Restyling every widget is expensive; skip it when nothing changes
+        if theme is self.style_manager.current_theme:
+            return
+
         self.style_manager.set_theme(theme)
 
         # Apply to main window
@@ -683,7 +686,7 @@ class MainWindow(QMainWindow):
             widget.style().polish(widget)
             widget.update()
 
-        theme_name = "Dark" if theme == Theme.DARK else "Light"
+        theme_name = "Dark" if theme is Theme.DARK else "Light"
         self.status_bar.showMessage(f"{theme_name} theme applied")
         logger.info(f"{theme_name} theme enabled")
 
@@ -734,6 +737,13 @@ class MainWindow(QMainWindow):
         """Handle window show event"""
         super().showEvent(event)
         logger.info("Main window shown")
+        # Render remaining icons once the first frame is on screen (first
+        # show only, not on every restore)
+        if not self._icons_warmed:
+            self._icons_warmed = True
+            QTimer.singleShot(
+                0, lambda: self.icon_manager.warm_cache(self._BUTTON_ICONS, sizes=(20,))
+            )
 
     def closeEvent(self, event):
         """Handle window close event"""
@@ -2,14 +2,19 @@
 Animation helper for smooth UI transitions and effects
 Provides reusable animation utilities for Qt widgets
 """
+import os
 from PySide6.QtCore import (
     QPropertyAnimation, QEasingCurve, QParallelAnimationGroup,
-    QSequentialAnimationGroup, QPoint, QSize, Property, QObject
+    QSequentialAnimationGroup, QAbstractAnimation, QVariantAnimation,
+    QPoint, QSize, Property, QObject, Qt
 )
-from PySide6.QtWidgets import QWidget, QGraphicsOpacityEffect
-from PySide6.QtGui import QColor
+from PySide6.QtWidgets import QWidget, QLabel, QGraphicsOpacityEffect
+from PySide6.QtGui import QColor, QPalette
 from typing import Optional, Callable
 
+# Set APP_ANIMATIONS=0 to disable UI animations (reduced motion / low-end machines)
+ANIMATIONS_ENABLED = os.environ.get("APP_ANIMATIONS", "1") != "0"
+
 
 class AnimationHelper:
     """Helper class for creating smooth UI animations"""
@@ -25,6 +30,39 @@ class AnimationHelper:
     EASE_IN = QEasingCurve.Type.InCubic
     EASE_BOUNCE = QEasingCurve.Type.OutBounce
 
+    @staticmethod
+    def _should_animate(widget: QWidget) -> bool:
+        """Check whether animating the widget would be visible to the user"""
+        if not ANIMATIONS_ENABLED:
+            return False
+        window = widget.window()
+        if window.windowState() & Qt.WindowState.WindowMinimized:
+            return False
+        return widget.isVisibleTo(window)
+
+    @staticmethod
+    def _ensure_opacity(widget: QWidget) -> QGraphicsOpacityEffect:
+        """Get the widget's opacity effect, installing it on first use"""
+        if widget.property("_hasOpacityEffect"):
+            effect = widget.graphicsEffect()
+            if effect is not None:
+                return effect
+
+        effect = QGraphicsOpacityEffect(widget)
+        widget.setGraphicsEffect(effect)
+        widget.setProperty("_hasOpacityEffect", True)
+        return effect
+
+    @staticmethod
+    def _idle_animation(kind=QPropertyAnimation):
+        """
+        Create a stopped, parentless animation to return in place of a skipped one
+
+        Each caller gets its own instance, so connecting to it or starting it
+        cannot affect other callers; it is freed once the caller drops it.
+        """
+        return kind()
+
     @staticmethod
     def fade_in(
         widget: QWidget,
@@ -40,15 +78,18 @@ class AnimationHelper:
             on_finished: Optional callback when animation completes
 
         Returns:
-            QPropertyAnimation instance
+            QPropertyAnimation instance (deleted by Qt once stopped)
         """
-        # Ensure widget has an opacity effect
-        if not widget.graphicsEffect():
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
-
-        effect = widget.graphicsEffect()
-        animation = QPropertyAnimation(effect, b"opacity")
+        if not AnimationHelper._should_animate(widget):
+            # Jump straight to the end state
+            if isinstance(widget.graphicsEffect(), QGraphicsOpacityEffect):
+                widget.graphicsEffect().setOpacity(1.0)
+            if on_finished:
+                on_finished()
+            return AnimationHelper._idle_animation()
+
+        effect = AnimationHelper._ensure_opacity(widget)
+        animation = QPropertyAnimation(effect, b"opacity", widget)
         animation.setDuration(duration)
         animation.setStartValue(0.0)
         animation.setEndValue(1.0)
@@ -57,7 +98,8 @@ class AnimationHelper:
         if on_finished:
             animation.finished.connect(on_finished)
 
-        animation.start()
+        # Owned by the widget and freed by Qt as soon as the last frame runs
+        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
         return animation
 
     @staticmethod
@@ -75,15 +117,15 @@ class AnimationHelper:
             on_finished: Optional callback when animation completes
 
         Returns:
-            QPropertyAnimation instance
+            QPropertyAnimation instance (deleted by Qt once stopped)
         """
-        # Ensure widget has an opacity effect
-        if not widget.graphicsEffect():
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
+        if not AnimationHelper._should_animate(widget):
+            if on_finished:
+                on_finished()
+            return AnimationHelper._idle_animation()
 
-        effect = widget.graphicsEffect()
-        animation = QPropertyAnimation(effect, b"opacity")
+        effect = AnimationHelper._ensure_opacity(widget)
+        animation = QPropertyAnimation(effect, b"opacity", widget)
         animation.setDuration(duration)
         animation.setStartValue(1.0)
         animation.setEndValue(0.0)
@@ -92,9 +134,85 @@ class AnimationHelper:
         if on_finished:
             animation.finished.connect(on_finished)
 
-        animation.start()
+        # Owned by the widget and freed by Qt as soon as the last frame runs
+        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        return animation
+
+    @staticmethod
+    def fade_label(
+        label: QLabel,
+        duration: int = DURATION_NORMAL,
+        fade_in: bool = True,
+        color: Optional[QColor] = None,
+        on_finished: Optional[Callable] = None
+    ) -> QVariantAnimation:
+        """
+        Fade a text label by animating the alpha of its stylesheet text color
+
+        Cheaper than QGraphicsOpacityEffect, which renders the widget through
+        an offscreen buffer on every frame.
+
+        Args:
+            label: Label to animate
+            duration: Animation duration in milliseconds
+            fade_in: Fade from transparent to opaque (False fades out)
+            color: Text color to fade (label's current text color if None)
+            on_finished: Optional callback when animation completes
+
+        Returns:
+            QVariantAnimation instance (deleted by Qt once stopped)
+        """
+        # Remember the label's own stylesheet across overlapping fades
+        base_style = label.property("_labelFadeBase")
+        if base_style is None:
+            base_style = label.styleSheet()
+            label.setProperty("_labelFadeBase", base_style)
+
+        for running in label.findChildren(QVariantAnimation, "_labelFade"):
+            running.stop()
+
+        def finish():
+            if on_finished:
+                on_finished()
+            label.setStyleSheet(base_style)
+            label.setProperty("_labelFadeBase", None)
+
+        if not AnimationHelper._should_animate(label):
+            finish()
+            return AnimationHelper._idle_animation(QVariantAnimation)
+
+        if color is None:
+            color = label.palette().color(QPalette.ColorRole.WindowText)
+        rgb = f"{color.red()}, {color.green()}, {color.blue()}"
+
+        # Override only the text color; rule blocks need a selector
+        if "{" in base_style:
+            prefix, suffix = f"{base_style}\nQLabel {{ color: rgba({rgb}, ", "); }"
+        else:
+            declarations = base_style.rstrip()
+            if declarations and not declarations.endswith(";"):
+                declarations += ";"
+            prefix, suffix = f"{declarations}\ncolor: rgba({rgb}, ", ");"
+
+        animation = QVariantAnimation(label)
+        animation.setObjectName("_labelFade")
+        animation.setDuration(duration)
+        animation.setStartValue(0 if fade_in else 255)
+        animation.setEndValue(255 if fade_in else 0)
+        animation.setEasingCurve(AnimationHelper.EASE_OUT if fade_in else AnimationHelper.EASE_IN)
+        animation.valueChanged.connect(
+            lambda alpha: label.setStyleSheet(f"{prefix}{alpha}{suffix}")
+        )
+        animation.finished.connect(finish)
+
+        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
         return animation
 
+    @staticmethod
+    def _is_text_label(widget: QWidget) -> bool:
+        """Check whether the widget's whole visual is its label text"""
+        return isinstance(widget, QLabel) and widget.pixmap().isNull()
+
     @staticmethod
     def slide_in_from_top(
         widget: QWidget,
@@ -110,22 +228,26 @@ class AnimationHelper:
             distance: Distance to slide (uses widget height if None)
 
         Returns:
-            QPropertyAnimation instance
+            QPropertyAnimation instance (deleted by Qt once stopped)
         """
+        if not AnimationHelper._should_animate(widget):
+            return AnimationHelper._idle_animation()
+
         if distance is None:
             distance = widget.height()
 
-        start_pos = QPoint(widget.x(), widget.y() - distance)
         end_pos = widget.pos()
+        start_pos = end_pos + QPoint(0, -distance)
 
-        animation = QPropertyAnimation(widget, b"pos")
+        animation = QPropertyAnimation(widget, b"pos", widget)
         animation.setDuration(duration)
         animation.setStartValue(start_pos)
         animation.setEndValue(end_pos)
         animation.setEasingCurve(AnimationHelper.EASE_OUT)
 
         widget.move(start_pos)
-        animation.start()
+        # Owned by the widget and freed by Qt as soon as the last frame runs
+        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
         return animation
 
     @staticmethod
@@ -143,22 +265,26 @@ class AnimationHelper:
             distance: Distance to slide (uses widget height if None)
 
         Returns:
-            QPropertyAnimation instance
+            QPropertyAnimation instance (deleted by Qt once stopped)
         """
+        if not AnimationHelper._should_animate(widget):
+            return AnimationHelper._idle_animation()
+
         if distance is None:
             distance = widget.height()
 
-        start_pos = QPoint(widget.x(), widget.y() + distance)
         end_pos = widget.pos()
+        start_pos = end_pos + QPoint(0, distance)
 
-        animation = QPropertyAnimation(widget, b"pos")
+        animation = QPropertyAnimation(widget, b"pos", widget)
         animation.setDuration(duration)
         animation.setStartValue(start_pos)
         animation.setEndValue(end_pos)
         animation.setEasingCurve(AnimationHelper.EASE_OUT)
 
         widget.move(start_pos)
-        animation.start()
+        # Owned by the widget and freed by Qt as soon as the last frame runs
+        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
         return animation
 
     @staticmethod
@@ -176,22 +302,26 @@ class AnimationHelper:
             distance: Distance to slide (uses widget width if None)
 
         Returns:
-            QPropertyAnimation instance
+            QPropertyAnimation instance (deleted by Qt once stopped)
         """
+        if not AnimationHelper._should_animate(widget):
+            return AnimationHelper._idle_animation()
+
         if distance is None:
             distance = widget.width()
 
-        start_pos = QPoint(widget.x() - distance, widget.y())
         end_pos = widget.pos()
+        start_pos = end_pos + QPoint(-distance, 0)
 
-        animation = QPropertyAnimation(widget, b"pos")
+        animation = QPropertyAnimation(widget, b"pos", widget)
         animation.setDuration(duration)
         animation.setStartValue(start_pos)
         animation.setEndValue(end_pos)
         animation.setEasingCurve(AnimationHelper.EASE_OUT)
 
         widget.move(start_pos)
-        animation.start()
+        # Owned by the widget and freed by Qt as soon as the last frame runs
+        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
         return animation
 
     @staticmethod
@@ -207,18 +337,22 @@ class AnimationHelper:
             duration: Animation duration in milliseconds
 
         Returns:
-            QPropertyAnimation instance
+            QPropertyAnimation instance (deleted by Qt once stopped)
         """
+        if not AnimationHelper._should_animate(widget):
+            return AnimationHelper._idle_animation()
+
         target_size = widget.size()
         start_size = QSize(0, 0)
 
-        animation = QPropertyAnimation(widget, b"size")
+        animation = QPropertyAnimation(widget, b"size", widget)
         animation.setDuration(duration)
         animation.setStartValue(start_size)
         animation.setEndValue(target_size)
         animation.setEasingCurve(AnimationHelper.EASE_OUT)
 
-        animation.start()
+        # Owned by the widget and freed by Qt as soon as the last frame runs
+        animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
         return animation
 
     @staticmethod
@@ -238,43 +372,61 @@ class AnimationHelper:
         Returns:
             QParallelAnimationGroup containing both animations
         """
-        group = QParallelAnimationGroup()
+        if not AnimationHelper._should_animate(widget):
+            if isinstance(widget.graphicsEffect(), QGraphicsOpacityEffect):
+                widget.graphicsEffect().setOpacity(1.0)
+            return AnimationHelper._idle_animation(QParallelAnimationGroup)
 
         # Fade animation
-        if not widget.graphicsEffect():
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
+        effect = AnimationHelper._ensure_opacity(widget)
 
-        effect = widget.graphicsEffect()
-        fade_anim = QPropertyAnimation(effect, b"opacity")
-        fade_anim.setDuration(duration)
-        fade_anim.setStartValue(0.0)
-        fade_anim.setEndValue(1.0)
-        fade_anim.setEasingCurve(AnimationHelper.EASE_OUT)
+        # Reuse the group built on a previous call instead of reallocating
+        group = widget.property("_fadeSlideGroup")
+        if group is None:
+            group = QParallelAnimationGroup(widget)
+
+            fade_anim = QPropertyAnimation(effect, b"opacity")
+            fade_anim.setStartValue(0.0)
+            fade_anim.setEndValue(1.0)
+            fade_anim.setEasingCurve(AnimationHelper.EASE_OUT)
+
+            slide_anim = QPropertyAnimation(widget, b"pos")
+            slide_anim.setEasingCurve(AnimationHelper.EASE_OUT)
+
+            group.addAnimation(fade_anim)
+            group.addAnimation(slide_anim)
+            widget.setProperty("_fadeSlideGroup", group)
+            current_pos = widget.pos()
+        else:
+            fade_anim = group.animationAt(0)
+            slide_anim = group.animationAt(1)
+            # An interrupted slide leaves the widget mid-way; resume from its target
+            if group.state() == QAbstractAnimation.State.Running:
+                current_pos = slide_anim.endValue()
+            else:
+                current_pos = widget.pos()
+            group.stop()
+            fade_anim.setTargetObject(effect)
 
         # Slide animation
         distance = 30  # Subtle slide distance
-        current_pos = widget.pos()
 
         if slide_direction == "top":
-            start_pos = QPoint(current_pos.x(), current_pos.y() - distance)
+            offset = QPoint(0, -distance)
         elif slide_direction == "bottom":
-            start_pos = QPoint(current_pos.x(), current_pos.y() + distance)
+            offset = QPoint(0, distance)
         elif slide_direction == "left":
-            start_pos = QPoint(current_pos.x() - distance, current_pos.y())
+            offset = QPoint(-distance, 0)
         else:  # right
-            start_pos = QPoint(current_pos.x() + distance, current_pos.y())
+            offset = QPoint(distance, 0)
+        start_pos = current_pos + offset
 
-        slide_anim = QPropertyAnimation(widget, b"pos")
+        fade_anim.setDuration(duration)
         slide_anim.setDuration(duration)
         slide_anim.setStartValue(start_pos)
         slide_anim.setEndValue(current_pos)
-        slide_anim.setEasingCurve(AnimationHelper.EASE_OUT)
 
         widget.move(start_pos)
-
-        group.addAnimation(fade_anim)
-        group.addAnimation(slide_anim)
         group.start()
 
         return group
@@ -286,7 +438,7 @@ class AnimationHelper:
         scale_factor: float = 1.1
     ) -> QSequentialAnimationGroup:
         """
-        Create a pulse effect (grow and shrink)
+        Create a pulse effect (grow and shrink around the widget's center)
 
         Args:
             widget: Widget to animate
@@ -296,33 +448,67 @@ class AnimationHelper:
         Returns:
             QSequentialAnimationGroup containing pulse animation
         """
-        original_size = widget.size()
-        scaled_size = QSize(
-            int(original_size.width() * scale_factor),
-            int(original_size.height() * scale_factor)
-        )
+        if not AnimationHelper._should_animate(widget):
+            return AnimationHelper._idle_animation(QSequentialAnimationGroup)
+
+        # Reuse the grow/shrink pair built on a previous call
+        group = widget.property("_pulseGroup")
+        if group is None:
+            group = QSequentialAnimationGroup(widget)
+
+            # Both phases animate a scale factor; geometry is applied in one slot
+            grow_anim = QVariantAnimation()
+            grow_anim.setEasingCurve(AnimationHelper.EASE_OUT)
+            grow_anim.valueChanged.connect(
+                lambda factor: AnimationHelper._apply_pulse_factor(widget, factor)
+            )
+
+            shrink_anim = QVariantAnimation()
+            shrink_anim.setEasingCurve(AnimationHelper.EASE_IN)
+            shrink_anim.valueChanged.connect(
+                lambda factor: AnimationHelper._apply_pulse_factor(widget, factor)
+            )
+
+            group.addAnimation(grow_anim)
+            group.addAnimation(shrink_anim)
+            widget.setProperty("_pulseGroup", group)
+        else:
+            grow_anim = group.animationAt(0)
+            shrink_anim = group.animationAt(1)
+            # Don't let an interrupted pulse become the new resting geometry
+            if group.state() == QAbstractAnimation.State.Running:
+                group.stop()
+                widget.setGeometry(widget.property("_pulseGeometry"))
+
+        widget.setProperty("_pulseGeometry", widget.geometry())
 
         # Grow animation
-        grow_anim = QPropertyAnimation(widget, b"size")
         grow_anim.setDuration(duration)
-        grow_anim.setStartValue(original_size)
-        grow_anim.setEndValue(scaled_size)
-        grow_anim.setEasingCurve(AnimationHelper.EASE_OUT)
+        grow_anim.setStartValue(1.0)
+        grow_anim.setEndValue(scale_factor)
 
         # Shrink animation
-        shrink_anim = QPropertyAnimation(widget, b"size")
         shrink_anim.setDuration(duration)
-        shrink_anim.setStartValue(scaled_size)
-        shrink_anim.setEndValue(original_size)
-        shrink_anim.setEasingCurve(AnimationHelper.EASE_IN)
+        shrink_anim.setStartValue(scale_factor)
+        shrink_anim.setEndValue(1.0)
 
-        group = QSequentialAnimationGroup()
-        group.addAnimation(grow_anim)
-        group.addAnimation(shrink_anim)
         group.start()
 
         return group
 
+    @staticmethod
+    def _apply_pulse_factor(widget: QWidget, factor: float):
+        """Scale widget around its resting center with a single geometry update"""
+        base = widget.property("_pulseGeometry")
+        width = int(base.width() * factor)
+        height = int(base.height() * factor)
+        widget.setGeometry(
+            base.x() - (width - base.width()) // 2,
+            base.y() - (height - base.height()) // 2,
+            width,
+            height
+        )
+
     @staticmethod
     def smooth_show(
         widget: QWidget,
@@ -339,8 +525,17 @@ class AnimationHelper:
         """
         widget.show()
 
+        if not AnimationHelper._should_animate(widget):
+            # Undo any opacity left at 0 by an animated smooth_hide
+            if isinstance(widget.graphicsEffect(), QGraphicsOpacityEffect):
+                widget.graphicsEffect().setOpacity(1.0)
+            return
+
         if animation_type == "fade":
-            AnimationHelper.fade_in(widget, duration)
+            if AnimationHelper._is_text_label(widget):
+                AnimationHelper.fade_label(widget, duration)
+            else:
+                AnimationHelper.fade_in(widget, duration)
         elif animation_type == "slide_bottom":
             AnimationHelper.slide_in_from_bottom(widget, duration)
         elif animation_type == "slide_top":
@@ -362,7 +557,14 @@ class AnimationHelper:
             animation_type: Type of animation ("fade")
             duration: Animation duration in milliseconds
         """
+        if not AnimationHelper._should_animate(widget):
+            widget.hide()
+            return
+
         if animation_type == "fade":
-            AnimationHelper.fade_out(widget, duration, lambda: widget.hide())
+            if AnimationHelper._is_text_label(widget):
+                AnimationHelper.fade_label(widget, duration, fade_in=False, on_finished=widget.hide)
+            else:
+                AnimationHelper.fade_out(widget, duration, lambda: widget.hide())
         else:
             widget.hide()
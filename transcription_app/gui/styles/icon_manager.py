@@ -3,9 +3,10 @@ Icon manager for consistent iconography across the application
 Uses Qt standard icons and Unicode symbols for Material Design-style appearance
 """
 from PySide6.QtWidgets import QStyle, QApplication
-from PySide6.QtGui import QIcon, QPixmap, QPainter, QColor
+from PySide6.QtGui import QIcon, QImage, QPixmap, QPainter, QColor
 from PySide6.QtCore import Qt, QSize
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
 
 
 class IconManager:
@@ -52,6 +53,9 @@ class IconManager:
         'subtitle': '\U0001F4FA',  # 📺
     }
 
+    # Application style, resolved on first standard icon lookup
+    _cached_style: Optional[QStyle] = None
+
     def __init__(self, default_size: int = 16):
         """
         Initialize icon manager
@@ -73,11 +77,23 @@ class IconManager:
         Returns:
             QIcon instance
         """
-        style = QApplication.style()
+        style = IconManager._cached_style or IconManager._cache_style()
         if style:
-            return style.standardIcon(icon_type)
+            return IconManager._standard_icon(icon_type)
         return QIcon()
 
+    @staticmethod
+    def _cache_style() -> Optional[QStyle]:
+        """Look up the application style once it exists and remember it"""
+        IconManager._cached_style = QApplication.style()
+        return IconManager._cached_style
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _standard_icon(icon_type: QStyle.StandardPixmap) -> QIcon:
+        """Build a standard icon from the cached style (memoized per icon type)"""
+        return IconManager._cached_style.standardIcon(icon_type)
+
     def create_text_icon(
         self,
         text: str,
@@ -108,12 +124,12 @@ class IconManager:
         if cache_key in self._icon_cache:
             return self._icon_cache[cache_key]
 
-        # Create pixmap
-        pixmap = QPixmap(size, size)
-        pixmap.fill(background if background else Qt.GlobalColor.transparent)
+        # Render into a fresh image; the pixmap below takes over its data
+        image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(background if background else Qt.GlobalColor.transparent)
 
         # Draw text
-        painter = QPainter(pixmap)
+        painter = QPainter(image)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         painter.setPen(color)
 
@@ -122,9 +138,10 @@ class IconManager:
         font.setPixelSize(int(size * 0.7))
         painter.setFont(font)
 
-        painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, text)
+        painter.drawText(image.rect(), Qt.AlignmentFlag.AlignCenter, text)
         painter.end()
 
+        pixmap = QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
         icon = QIcon(pixmap)
         self._icon_cache[cache_key] = icon
         return icon
@@ -237,6 +254,33 @@ class IconManager:
         painter.end()
         return QIcon(pixmap)
 
+    def warm_cache(
+        self,
+        names: Iterable[str],
+        sizes: Tuple[int, ...] = (20,),
+        colors: Optional[Tuple[QColor, ...]] = None
+    ):
+        """
+        Pre-render the given icons so first use doesn't pay the drawing cost
+
+        Must run on the GUI thread (QPixmap is not thread-safe).
+
+        Args:
+            names: Icon names from ICONS dict; other names are skipped
+            sizes: Icon sizes in pixels to render (button size by default)
+            colors: Icon colors to render (black, the default icon color, if None)
+        """
+        if colors is None:
+            colors = (QColor(Qt.GlobalColor.black),)
+
+        for name in names:
+            symbol = self.ICONS.get(name)
+            if symbol is None:
+                continue
+            for size in sizes:
+                for color in colors:
+                    self.create_text_icon(symbol, size, color)
+
     def clear_cache(self):
         """Clear the icon cache"""
         self._icon_cache.clear()
@@ -3,9 +3,14 @@ Centralized stylesheet management for the application
 Provides theme switching and consistent styling across all widgets
 Modern 2025 design system with complete design tokens
 """
+import re
+import sys
+from contextlib import contextmanager
 from enum import Enum
-from typing import Dict
-from dataclasses import dataclass
+from string import Template
+from types import MappingProxyType
+from typing import Callable, Dict, NamedTuple, Tuple
+from functools import lru_cache
 
 
 class Theme(Enum):
@@ -14,9 +19,13 @@ class Theme(Enum):
     DARK = "dark"
 
 
-@dataclass
-class ColorPalette:
-    """Complete color palette and design tokens for a theme"""
+class ColorPalette(NamedTuple):
+    """
+    Complete color palette and design tokens for a theme
+
+    Stored as a flat immutable tuple; fields are read through C-level
+    index accessors.
+    """
 
     # ===== PRIMARY COLORS =====
     primary_50: str
@@ -77,10 +86,26 @@ class ColorPalette:
     border_focus: str
 
 
+@lru_cache(maxsize=2)
+def _palette_params(palette: ColorPalette) -> Dict[str, str]:
+    """Flat field name -> value mapping of a palette, built once per palette"""
+    return palette._asdict()
+
+
+def _intern_palette(palette: ColorPalette) -> ColorPalette:
+    """Return the palette with every value interned, so repeated colors share one string"""
+    return palette._make(sys.intern(value) for value in palette)
+
+
 # ===== DESIGN TOKENS (Module-level constants) =====
+# Compact tokens for the hand-styled widgets (DropZoneWidget, FileQueueWidget,
+# MainWindow layout margins). The application stylesheet uses its own, larger
+# scale on StyleSheetManager; the values intentionally differ, so the two
+# tables must not be merged without restyling one of the consumers. All token
+# tables are read-only views.
 
 # Spacing scale (compact 4px grid system)
-SPACING = {
+SPACING = MappingProxyType({
     'xs': '2px',    # Extra small
     'sm': '4px',    # Small
     'md': '8px',    # Medium
@@ -90,20 +115,23 @@ SPACING = {
     '2xl': '24px',  # 2x large
     '3xl': '32px',  # 3x large
     '4xl': '40px',  # 4x large
-}
+})
+
+# Spacing scale as integer pixels, for layout margins and spacing
+SPACING_PX = MappingProxyType({name: int(value[:-2]) for name, value in SPACING.items()})
 
 # Border radius scale (Modern 2025 - more rounded for sleek look)
-RADIUS = {
+RADIUS = MappingProxyType({
     'sm': '6px',     # Small buttons, inputs
     'md': '8px',     # Medium cards, panels
     'lg': '12px',    # Large cards
     'xl': '16px',    # Extra large modals
     '2xl': '20px',   # Very rounded
     'full': '9999px', # Circle/pill buttons
-}
+})
 
 # Modern Typography 2025 (Spotify/Discord inspired)
-TYPOGRAPHY = {
+TYPOGRAPHY = MappingProxyType({
     # Font families - modern system fonts
     'font_primary': "'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica Neue', Arial, sans-serif",
     'font_mono': "'JetBrains Mono', 'Fira Code', 'SF Mono', 'Consolas', 'Monaco', monospace",
@@ -126,134 +154,519 @@ TYPOGRAPHY = {
     'weight_semibold': '600',
     'weight_bold': '700',
     'weight_extrabold': '800',
+})
+
+
+# Brand accents shared by several palette roles (primary, focus, info)
+BRAND_PRIMARY_LIGHT = "#2196F3"  # Material blue
+BRAND_PRIMARY_DARK = "#0D9488"   # Professional teal
+
+# ===== MODERN LIGHT THEME (Material Design 3 inspired) =====
+_LIGHT_PALETTE = ColorPalette(
+    # Primary colors
+    primary_50="#E3F2FD",
+    primary_100="#BBDEFB",
+    primary_300="#64B5F6",
+    primary_500=BRAND_PRIMARY_LIGHT,
+    primary_600="#1E88E5",
+    primary_700="#1976D2",
+
+    # Neutrals
+    neutral_0="#FFFFFF",
+    neutral_50="#FAFAFA",
+    neutral_100="#F5F5F5",
+    neutral_200="#EEEEEE",
+    neutral_300="#E0E0E0",
+    neutral_400="#BDBDBD",
+    neutral_500="#9E9E9E",
+    neutral_600="#757575",
+    neutral_700="#616161",
+    neutral_900="#212121",
+
+    # Semantic colors
+    success_light="#E8F5E9",
+    success_main="#4CAF50",
+    success_dark="#2E7D32",
+
+    warning_light="#FFF3E0",
+    warning_main="#FF9800",
+    warning_dark="#E65100",
+
+    error_light="#FFEBEE",
+    error_main="#F44336",
+    error_dark="#C62828",
+
+    info_light="#E3F2FD",
+    info_main=BRAND_PRIMARY_LIGHT,
+    info_dark="#1565C0",
+
+    # Surface elevation
+    surface_0="#FFFFFF",
+    surface_1="#FAFAFA",
+    surface_2="#F5F5F5",
+    surface_3="#F0F0F0",
+
+    # Shadows (Material Design elevation)
+    shadow_sm="0 1px 2px 0 rgba(0, 0, 0, 0.05)",
+    shadow_md="0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
+    shadow_lg="0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)",
+    shadow_xl="0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)",
+
+    # Legacy compatibility
+    background="#FFFFFF",
+    foreground="#212121",
+    text_primary="#212121",
+    text_secondary="#616161",
+    border="#E0E0E0",
+    border_focus=BRAND_PRIMARY_LIGHT,
+)
+
+# ===== MODERN DARK THEME 2025 (Professional Teal/Cyan) =====
+_DARK_PALETTE = ColorPalette(
+    # Professional teal/cyan accent (sophisticated, not toxic)
+    primary_50="#5EEAD4",  # Light teal for hover
+    primary_100="#2DD4BF",
+    primary_300="#14B8A6",  # Medium teal
+    primary_500=BRAND_PRIMARY_DARK,  # Main professional teal
+    primary_600="#0F766E",
+    primary_700="#115E59",
+
+    # Sleek dark neutrals (Discord/Spotify inspired)
+    neutral_0="#FFFFFF",
+    neutral_50="#F0F0F0",
+    neutral_100="#E0E0E0",
+    neutral_200="#B3B3B3",
+    neutral_300="#808080",
+    neutral_400="#535353",
+    neutral_500="#404040",
+    neutral_600="#2E2E2E",
+    neutral_700="#1E1E1E",
+    neutral_900="#0A0A0A",  # Almost black background
+
+    # Vibrant semantic colors (professional tones)
+    success_light="#166534",
+    success_main="#10B981",  # Professional emerald green
+    success_dark="#059669",
+
+    warning_light="#E67E22",
+    warning_main="#F39C12",  # Warm orange
+    warning_dark="#F1C40F",
+
+    error_light="#C0392B",
+    error_main="#E74C3C",  # Bright red
+    error_dark="#EC7063",
+
+    info_light="#2980B9",
+    info_main="#3498DB",  # Bright blue
+    info_dark="#5DADE2",
+
+    # Deep dark surfaces with subtle elevation
+    surface_0="#0A0A0A",  # Deepest black
+    surface_1="#121212",  # Cards
+    surface_2="#1A1A1A",  # Elevated elements
+    surface_3="#242424",  # Dialogs/modals
+
+    # Enhanced shadows with glow effects
+    shadow_sm="0 2px 4px 0 rgba(0, 0, 0, 0.4)",
+    shadow_md="0 4px 12px -2px rgba(0, 0, 0, 0.5), 0 2px 6px -1px rgba(0, 0, 0, 0.4)",
+    shadow_lg="0 10px 24px -4px rgba(0, 0, 0, 0.6), 0 4px 12px -2px rgba(0, 0, 0, 0.5)",
+    shadow_xl="0 20px 40px -8px rgba(0, 0, 0, 0.7), 0 10px 20px -5px rgba(0, 0, 0, 0.5)",
+
+    # Legacy compatibility
+    background="#0A0A0A",
+    foreground="#F0F0F0",
+    text_primary="#F0F0F0",
+    text_secondary="#B3B3B3",
+    border="#2E2E2E",
+    border_focus=BRAND_PRIMARY_DARK,  # Professional teal
+)
+
+_LIGHT_PALETTE = _intern_palette(_LIGHT_PALETTE)
+_DARK_PALETTE = _intern_palette(_DARK_PALETTE)
+
+_PALETTES: Dict[Theme, ColorPalette] = {
+    Theme.LIGHT: _LIGHT_PALETTE,
+    Theme.DARK: _DARK_PALETTE,
 }
 
+# Stylesheet values that differ between light and dark themes, resolved once
+_THEME_PARAMS: Dict[Theme, Dict[str, str]] = {
+    Theme.LIGHT: dict(
+        content_bg="white",
+        raised_bg="white",
+        selected_bg=_LIGHT_PALETTE.primary_50,
+        selected_fg=_LIGHT_PALETTE.primary_500,
+        item_hover_bg=_LIGHT_PALETTE.neutral_50,
+    ),
+    Theme.DARK: dict(
+        content_bg=_DARK_PALETTE.surface_0,      # Text edits and lists
+        raised_bg=_DARK_PALETTE.surface_1,       # Inputs, combo boxes and menus
+        selected_bg=_DARK_PALETTE.surface_2,
+        selected_fg="white",
+        item_hover_bg=_DARK_PALETTE.surface_2,
+    ),
+}
+
+_AVAILABLE_THEMES: Tuple[Theme, ...] = (Theme.LIGHT, Theme.DARK)
+
+
+def _minify_qss(qss: str) -> str:
+    """Strip comments and redundant whitespace so Qt has less QSS to parse"""
+    qss = _QSS_COMMENT.sub("", qss)
+    qss = _QSS_WHITESPACE.sub(" ", qss).strip()
+    return _QSS_PUNCTUATION_SPACE.sub(r"\1", qss)
+
+
+_QSS_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
+_QSS_WHITESPACE = re.compile(r"\s+")
+# Spaces next to structural punctuation; spaces between values and in
+# descendant selectors are left alone
+_QSS_PUNCTUATION_SPACE = re.compile(r" ?([{};:,]) ?")
+
+
+# ===== STYLESHEET TEMPLATE =====
+
+# Complete application stylesheet; $placeholders are palette fields, design
+# tokens (spacing_*, radius_*, typography keys) and theme-dependent values
+_QSS_TEMPLATE = Template("""
+        * {
+            outline: none;
+        }
+        
+
+        QMainWindow {
+            background-color: $background;
+        }
+
+        QWidget {
+            font-family: $font_primary;
+            font-size: $size_base;
+        }
+        
+
+        QPushButton {
+            background-color: $primary_500;
+            color: white;
+            border: none;
+            border-radius: $radius_md;
+            padding: 12px 24px;
+            font-size: $size_base;
+            font-weight: $weight_semibold;
+            font-family: $font_primary;
+        }
+        QPushButton:hover {
+            background-color: $primary_600;
+        }
+        QPushButton:pressed {
+            background-color: $primary_700;
+        }
+        QPushButton:disabled {
+            background-color: $neutral_300;
+            color: $neutral_500;
+        }
+
+        /* Secondary button variant */
+        QPushButton[variant="secondary"] {
+            background-color: transparent;
+            color: $primary_500;
+            border: 2px solid $neutral_300;
+            padding: 10px 22px;
+        }
+        QPushButton[variant="secondary"]:hover {
+            border-color: $primary_500;
+            background-color: $primary_50;
+        }
+        
+
+        QTextEdit {
+            background-color: $content_bg;
+            color: $text_primary;
+            border: 2px solid $border;
+            border-radius: $radius_md;
+            padding: $spacing_md;
+            font-family: $font_mono;
+            font-size: $size_sm;
+        }
+        QTextEdit:focus {
+            border-color: $border_focus;
+        }
+        
+
+        QListWidget {
+            background-color: $content_bg;
+            color: $text_primary;
+            border: 2px solid $border;
+            border-radius: $radius_md;
+            padding: $spacing_sm;
+            font-family: $font_mono;
+        }
+        QListWidget:focus {
+            border-color: $border_focus;
+        }
+        QListWidget::item {
+            padding: $spacing_sm;
+            border-radius: $radius_sm;
+            margin: 2px 0;
+        }
+        QListWidget::item:selected {
+            background-color: $selected_bg;
+            color: $text_primary;
+        }
+        QListWidget::item:hover {
+            background-color: $surface_1;
+        }
+        
+
+        QStatusBar {
+            background-color: $surface_1;
+            color: $text_secondary;
+            border-top: 1px solid $border;
+            font-size: $size_sm;
+            font-weight: $weight_medium;
+            padding: $spacing_xs;
+        }
+        
+
+        QGroupBox {
+            font-weight: $weight_semibold;
+            font-size: $size_md;
+            color: $text_primary;
+            border: 1px solid $border;
+            border-radius: $radius_lg;
+            margin-top: $spacing_base;
+            padding: $spacing_xl $spacing_base $spacing_base $spacing_base;
+            background-color: $surface_1;
+        }
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            subcontrol-position: top left;
+            padding: 0 $spacing_md;
+            background-color: $background;
+            color: $text_primary;
+        }
+        
+
+        QMenuBar {
+            background-color: $background;
+            color: $text_primary;
+            border-bottom: 1px solid $border;
+            font-size: $size_sm;
+            font-weight: $weight_medium;
+            padding: $spacing_xs 0;
+        }
+        QMenuBar::item {
+            padding: $spacing_sm $spacing_md;
+            background-color: transparent;
+            color: $text_primary;
+            border-radius: $radius_sm;
+            margin: 0 $spacing_xs;
+        }
+        QMenuBar::item:selected {
+            background-color: $surface_1;
+            color: $primary_500;
+        }
+
+        QMenu {
+            background-color: $raised_bg;
+            color: $text_primary;
+            border: 1px solid $border;
+            border-radius: $radius_md;
+            padding: $spacing_xs;
+        }
+        QMenu::item {
+            padding: $spacing_sm $spacing_xl $spacing_sm $spacing_lg;
+            border-radius: $radius_sm;
+            margin: 2px $spacing_xs;
+        }
+        QMenu::item:selected {
+            background-color: $selected_bg;
+            color: $selected_fg;
+        }
+        QMenu::separator {
+            height: 1px;
+            background-color: $border;
+            margin: $spacing_xs $spacing_md;
+        }
+        
+
+        QScrollBar:vertical {
+            border: none;
+            background: transparent;
+            width: 8px;
+            margin: 0;
+        }
+        QScrollBar::handle:vertical {
+            background: $neutral_400;
+            border-radius: $radius_sm;
+            min-height: 40px;
+        }
+        QScrollBar::handle:vertical:hover {
+            background: $neutral_500;
+        }
+        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+            border: none;
+            background: none;
+            height: 0;
+        }
+        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {
+            background: none;
+        }
+
+        QScrollBar:horizontal {
+            border: none;
+            background: transparent;
+            height: 8px;
+            margin: 0;
+        }
+        QScrollBar::handle:horizontal {
+            background: $neutral_400;
+            border-radius: $radius_sm;
+            min-width: 40px;
+        }
+        QScrollBar::handle:horizontal:hover {
+            background: $neutral_500;
+        }
+        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+            border: none;
+            background: none;
+            width: 0;
+        }
+        
+
+        QSplitter::handle {
+            background-color: $border;
+            margin: 0;
+        }
+        QSplitter::handle:hover {
+            background-color: $primary_500;
+        }
+        QSplitter::handle:vertical {
+            height: 2px;
+        }
+        QSplitter::handle:horizontal {
+            width: 2px;
+        }
+        
+
+        QLineEdit {
+            background-color: $raised_bg;
+            color: $text_primary;
+            border: 2px solid $border;
+            border-radius: $radius_md;
+            padding: $spacing_md $spacing_base;
+            font-size: $size_base;
+        }
+        QLineEdit:hover {
+            border-color: $neutral_400;
+        }
+        QLineEdit:focus {
+            border-color: $border_focus;
+        }
+        QLineEdit:disabled {
+            background-color: $neutral_100;
+            color: $neutral_500;
+        }
+        
+
+        QLabel {
+            color: $text_primary;
+        }
+        
+
+        QCheckBox {
+            color: $text_primary;
+            spacing: $spacing_sm;
+        }
+        QCheckBox::indicator {
+            width: 18px;
+            height: 18px;
+            border-radius: $radius_sm;
+            border: 2px solid $border;
+            background-color: $background;
+        }
+        QCheckBox::indicator:hover {
+            border-color: $neutral_400;
+        }
+        QCheckBox::indicator:checked {
+            background-color: $primary_500;
+            border-color: $primary_500;
+        }
+        
+
+        QProgressBar {
+            border: none;
+            border-radius: $radius_full;
+            background-color: $neutral_200;
+            height: 8px;
+            text-align: center;
+        }
+        QProgressBar::chunk {
+            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                stop:0 $primary_500,
+                stop:1 $primary_300);
+            border-radius: $radius_full;
+        }
+        
+
+        QComboBox {
+            background-color: $raised_bg;
+            color: $text_primary;
+            border: 2px solid $border;
+            border-radius: $radius_md;
+            padding: $spacing_md $spacing_base;
+            font-size: $size_base;
+            min-height: 20px;
+        }
+        QComboBox:hover {
+            border-color: $neutral_400;
+        }
+        QComboBox:focus {
+            border-color: $border_focus;
+        }
+        QComboBox::drop-down {
+            border: none;
+            width: 32px;
+        }
+        QComboBox::down-arrow {
+            image: none;
+            border: 2px solid $neutral_600;
+            width: 8px;
+            height: 8px;
+            border-top: none;
+            border-left: none;
+            margin-right: $spacing_md;
+        }
+        QComboBox QAbstractItemView {
+            background-color: $raised_bg;
+            color: $text_primary;
+            border: 1px solid $border;
+            border-radius: $radius_md;
+            selection-background-color: $selected_bg;
+            selection-color: $text_primary;
+        }
+        QComboBox QAbstractItemView::item {
+            color: $text_primary;
+            padding: $spacing_sm;
+        }
+        QComboBox QAbstractItemView::item:hover {
+            background-color: $item_hover_bg;
+            color: $text_primary;
+        }
+        """)
+
 
 class StyleSheetManager:
     """Manages application stylesheets with modern 2025 design system"""
 
-    # ===== MODERN LIGHT THEME (Material Design 3 inspired) =====
-    LIGHT_PALETTE = ColorPalette(
-        # Primary colors
-        primary_50="#E3F2FD",
-        primary_100="#BBDEFB",
-        primary_300="#64B5F6",
-        primary_500="#2196F3",
-        primary_600="#1E88E5",
-        primary_700="#1976D2",
-
-        # Neutrals
-        neutral_0="#FFFFFF",
-        neutral_50="#FAFAFA",
-        neutral_100="#F5F5F5",
-        neutral_200="#EEEEEE",
-        neutral_300="#E0E0E0",
-        neutral_400="#BDBDBD",
-        neutral_500="#9E9E9E",
-        neutral_600="#757575",
-        neutral_700="#616161",
-        neutral_900="#212121",
-
-        # Semantic colors
-        success_light="#E8F5E9",
-        success_main="#4CAF50",
-        success_dark="#2E7D32",
-
-        warning_light="#FFF3E0",
-        warning_main="#FF9800",
-        warning_dark="#E65100",
-
-        error_light="#FFEBEE",
-        error_main="#F44336",
-        error_dark="#C62828",
-
-        info_light="#E3F2FD",
-        info_main="#2196F3",
-        info_dark="#1565C0",
-
-        # Surface elevation
-        surface_0="#FFFFFF",
-        surface_1="#FAFAFA",
-        surface_2="#F5F5F5",
-        surface_3="#F0F0F0",
-
-        # Shadows (Material Design elevation)
-        shadow_sm="0 1px 2px 0 rgba(0, 0, 0, 0.05)",
-        shadow_md="0 4px 6px -1px rgba(0, 0, 0, 0.1), 0 2px 4px -1px rgba(0, 0, 0, 0.06)",
-        shadow_lg="0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -2px rgba(0, 0, 0, 0.05)",
-        shadow_xl="0 20px 25px -5px rgba(0, 0, 0, 0.1), 0 10px 10px -5px rgba(0, 0, 0, 0.04)",
-
-        # Legacy compatibility
-        background="#FFFFFF",
-        foreground="#212121",
-        text_primary="#212121",
-        text_secondary="#616161",
-        border="#E0E0E0",
-        border_focus="#2196F3",
-    )
+    __slots__ = ("current_theme", "_palette", "_theme_callbacks", "_batch_depth", "_pending_theme")
 
-    # ===== MODERN DARK THEME 2025 (Professional Teal/Cyan) =====
-    DARK_PALETTE = ColorPalette(
-        # Professional teal/cyan accent (sophisticated, not toxic)
-        primary_50="#5EEAD4",  # Light teal for hover
-        primary_100="#2DD4BF",
-        primary_300="#14B8A6",  # Medium teal
-        primary_500="#0D9488",  # Main professional teal
-        primary_600="#0F766E",
-        primary_700="#115E59",
-
-        # Sleek dark neutrals (Discord/Spotify inspired)
-        neutral_0="#FFFFFF",
-        neutral_50="#F0F0F0",
-        neutral_100="#E0E0E0",
-        neutral_200="#B3B3B3",
-        neutral_300="#808080",
-        neutral_400="#535353",
-        neutral_500="#404040",
-        neutral_600="#2E2E2E",
-        neutral_700="#1E1E1E",
-        neutral_900="#0A0A0A",  # Almost black background
-
-        # Vibrant semantic colors (professional tones)
-        success_light="#166534",
-        success_main="#10B981",  # Professional emerald green
-        success_dark="#059669",
-
-        warning_light="#E67E22",
-        warning_main="#F39C12",  # Warm orange
-        warning_dark="#F1C40F",
-
-        error_light="#C0392B",
-        error_main="#E74C3C",  # Bright red
-        error_dark="#EC7063",
-
-        info_light="#2980B9",
-        info_main="#3498DB",  # Bright blue
-        info_dark="#5DADE2",
-
-        # Deep dark surfaces with subtle elevation
-        surface_0="#0A0A0A",  # Deepest black
-        surface_1="#121212",  # Cards
-        surface_2="#1A1A1A",  # Elevated elements
-        surface_3="#242424",  # Dialogs/modals
-
-        # Enhanced shadows with glow effects
-        shadow_sm="0 2px 4px 0 rgba(0, 0, 0, 0.4)",
-        shadow_md="0 4px 12px -2px rgba(0, 0, 0, 0.5), 0 2px 6px -1px rgba(0, 0, 0, 0.4)",
-        shadow_lg="0 10px 24px -4px rgba(0, 0, 0, 0.6), 0 4px 12px -2px rgba(0, 0, 0, 0.5)",
-        shadow_xl="0 20px 40px -8px rgba(0, 0, 0, 0.7), 0 10px 20px -5px rgba(0, 0, 0, 0.5)",
-
-        # Legacy compatibility
-        background="#0A0A0A",
-        foreground="#F0F0F0",
-        text_primary="#F0F0F0",
-        text_secondary="#B3B3B3",
-        border="#2E2E2E",
-        border_focus="#0D9488",  # Professional teal
-    )
+    # Palettes (aliases of the module-level constants)
+    LIGHT_PALETTE = _LIGHT_PALETTE
+    DARK_PALETTE = _DARK_PALETTE
 
-    # Design tokens (spacing, typography, etc.)
-    SPACING = {
+    # Design tokens for the application stylesheet (see the module-level
+    # tables for the compact scale used by individual widgets)
+    SPACING = MappingProxyType({
         'xs': '4px',
         'sm': '8px',
         'md': '12px',
@@ -263,17 +676,17 @@ class StyleSheetManager:
         '2xl': '32px',
         '3xl': '40px',
         '4xl': '48px',
-    }
+    })
 
-    RADIUS = {
+    RADIUS = MappingProxyType({
         'sm': '4px',
         'md': '8px',
         'lg': '12px',
         'xl': '16px',
         'full': '9999px',
-    }
+    })
 
-    TYPOGRAPHY = {
+    TYPOGRAPHY = MappingProxyType({
         'font_primary': "-apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Oxygen', 'Ubuntu', 'Cantarell', 'Helvetica Neue', sans-serif",
         'font_mono': "'Consolas', 'Monaco', 'Courier New', monospace",
         'size_xs': '11px',
@@ -288,8 +701,19 @@ class StyleSheetManager:
         'weight_medium': '500',
         'weight_semibold': '600',
         'weight_bold': '700',
+    })
+
+    # Design tokens flattened into template parameters, built once
+    _TOKEN_PARAMS = {
+        **{f"spacing_{name}": value for name, value in SPACING.items()},
+        **{f"radius_{name}": value for name, value in RADIUS.items()},
+        **TYPOGRAPHY,
     }
 
+    # Stylesheet template with the theme-independent tokens already filled
+    # in; only palette and theme-dependent placeholders remain
+    _PALETTE_TEMPLATE = Template(_QSS_TEMPLATE.safe_substitute(_TOKEN_PARAMS))
+
     def __init__(self, theme: Theme = Theme.DARK):
         """
         Initialize the stylesheet manager
@@ -299,444 +723,136 @@ class StyleSheetManager:
         """
         self.current_theme = theme
         self._palette = self._get_palette(theme)
+        self._theme_callbacks = []
+        self._batch_depth = 0
+        self._pending_theme = None
 
-    def _get_palette(self, theme: Theme) -> ColorPalette:
-        """Get color palette for theme"""
-        if theme == Theme.DARK:
-            return self.DARK_PALETTE
-        return self.LIGHT_PALETTE
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _get_palette(theme: Theme) -> ColorPalette:
+        """Get color palette for theme (memoized for derived palette variants)"""
+        return _PALETTES[theme]
 
     def set_theme(self, theme: Theme):
         """
         Switch to a different theme
 
+        Inside a batch() block the switch is deferred until the block exits.
+        Switching to the current theme does nothing.
+
         Args:
             theme: Theme to switch to
         """
-        self.current_theme = theme
-        self._palette = self._get_palette(theme)
+        if self._batch_depth:
+            self._pending_theme = theme
+            return
+        self._apply_theme(theme)
 
-    def get_stylesheet(self) -> str:
-        """
-        Get complete stylesheet for current theme
-
-        Returns:
-            Complete QSS stylesheet string
-        """
-        components = [
-            self._get_base_style(),
-            self._get_main_window_style(),
-            self._get_button_style(),
-            self._get_text_edit_style(),
-            self._get_list_widget_style(),
-            self._get_status_bar_style(),
-            self._get_group_box_style(),
-            self._get_menu_style(),
-            self._get_scrollbar_style(),
-            self._get_splitter_style(),
-            self._get_line_edit_style(),
-            self._get_label_style(),
-            self._get_checkbox_style(),
-            self._get_progress_bar_style(),
-            self._get_combo_box_style(),
-        ]
-        return "\n".join(components)
-
-    def _get_base_style(self) -> str:
-        """Base styling and transitions"""
-        return """
-        * {
-            outline: none;
-        }
+    def on_theme_changed(self, callback: Callable[[Theme], None]):
         """
+        Register a callback invoked after the theme changes
 
-    def _get_main_window_style(self) -> str:
-        """Main window styling"""
-        return f"""
-        QMainWindow {{
-            background-color: {self._palette.background};
-        }}
-
-        QWidget {{
-            font-family: {self.TYPOGRAPHY['font_primary']};
-            font-size: {self.TYPOGRAPHY['size_base']};
-        }}
+        Args:
+            callback: Called with the new theme
         """
+        self._theme_callbacks.append(callback)
 
-    def _get_button_style(self) -> str:
-        """Modern button styling with shadows and transitions"""
-        return f"""
-        QPushButton {{
-            background-color: {self._palette.primary_500};
-            color: white;
-            border: none;
-            border-radius: {self.RADIUS['md']};
-            padding: 12px 24px;
-            font-size: {self.TYPOGRAPHY['size_base']};
-            font-weight: {self.TYPOGRAPHY['weight_semibold']};
-            font-family: {self.TYPOGRAPHY['font_primary']};
-        }}
-        QPushButton:hover {{
-            background-color: {self._palette.primary_600};
-        }}
-        QPushButton:pressed {{
-            background-color: {self._palette.primary_700};
-        }}
-        QPushButton:disabled {{
-            background-color: {self._palette.neutral_300};
-            color: {self._palette.neutral_500};
-        }}
-
-        /* Secondary button variant */
-        QPushButton[variant="secondary"] {{
-            background-color: transparent;
-            color: {self._palette.primary_500};
-            border: 2px solid {self._palette.neutral_300};
-            padding: 10px 22px;
-        }}
-        QPushButton[variant="secondary"]:hover {{
-            border-color: {self._palette.primary_500};
-            background-color: {self._palette.primary_50};
-        }}
+    @contextmanager
+    def batch(self):
         """
+        Coalesce several set_theme calls into a single theme change
 
-    def _get_text_edit_style(self) -> str:
-        """Modern text edit styling"""
-        bg_color = self._palette.surface_0 if self.current_theme == Theme.DARK else "white"
-
-        return f"""
-        QTextEdit {{
-            background-color: {bg_color};
-            color: {self._palette.text_primary};
-            border: 2px solid {self._palette.border};
-            border-radius: {self.RADIUS['md']};
-            padding: {self.SPACING['md']};
-            font-family: {self.TYPOGRAPHY['font_mono']};
-            font-size: {self.TYPOGRAPHY['size_sm']};
-        }}
-        QTextEdit:focus {{
-            border-color: {self._palette.border_focus};
-        }}
+        Usage:
+            with manager.batch():
+                manager.set_theme(Theme.LIGHT)
+                manager.set_theme(Theme.DARK)  # only this one is applied
         """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self._flush()
+
+    def _flush(self):
+        """Apply the last theme requested during a batch"""
+        if self._pending_theme is not None:
+            theme, self._pending_theme = self._pending_theme, None
+            self._apply_theme(theme)
+
+    def _apply_theme(self, theme: Theme):
+        """Switch palettes and notify callbacks"""
+        if theme is self.current_theme:
+            return
+        self.current_theme = theme
+        self._palette = self._get_palette(theme)
+        for callback in self._theme_callbacks:
+            callback(theme)
 
-    def _get_list_widget_style(self) -> str:
-        """Modern list widget styling"""
-        bg_color = self._palette.surface_0 if self.current_theme == Theme.DARK else "white"
-
-        return f"""
-        QListWidget {{
-            background-color: {bg_color};
-            color: {self._palette.text_primary};
-            border: 2px solid {self._palette.border};
-            border-radius: {self.RADIUS['md']};
-            padding: {self.SPACING['sm']};
-            font-family: {self.TYPOGRAPHY['font_mono']};
-        }}
-        QListWidget:focus {{
-            border-color: {self._palette.border_focus};
-        }}
-        QListWidget::item {{
-            padding: {self.SPACING['sm']};
-            border-radius: {self.RADIUS['sm']};
-            margin: 2px 0;
-        }}
-        QListWidget::item:selected {{
-            background-color: {self._palette.primary_50 if self.current_theme == Theme.LIGHT else self._palette.surface_2};
-            color: {self._palette.text_primary};
-        }}
-        QListWidget::item:hover {{
-            background-color: {self._palette.surface_1};
-        }}
+    def get_stylesheet(self, pretty: bool = False) -> str:
         """
+        Get complete stylesheet for current theme
 
-    def _get_status_bar_style(self) -> str:
-        """Flat, modern status bar"""
-        return f"""
-        QStatusBar {{
-            background-color: {self._palette.surface_1};
-            color: {self._palette.text_secondary};
-            border-top: 1px solid {self._palette.border};
-            font-size: {self.TYPOGRAPHY['size_sm']};
-            font-weight: {self.TYPOGRAPHY['weight_medium']};
-            padding: {self.SPACING['xs']};
-        }}
-        """
+        The result depends only on the theme, so it is built once per theme
+        and shared by every manager instance.
 
-    def _get_group_box_style(self) -> str:
-        """Modern, lightweight group box"""
-        return f"""
-        QGroupBox {{
-            font-weight: {self.TYPOGRAPHY['weight_semibold']};
-            font-size: {self.TYPOGRAPHY['size_md']};
-            color: {self._palette.text_primary};
-            border: 1px solid {self._palette.border};
-            border-radius: {self.RADIUS['lg']};
-            margin-top: {self.SPACING['base']};
-            padding: {self.SPACING['xl']} {self.SPACING['base']} {self.SPACING['base']} {self.SPACING['base']};
-            background-color: {self._palette.surface_1};
-        }}
-        QGroupBox::title {{
-            subcontrol-origin: margin;
-            subcontrol-position: top left;
-            padding: 0 {self.SPACING['md']};
-            background-color: {self._palette.background};
-            color: {self._palette.text_primary};
-        }}
-        """
+        Args:
+            pretty: Return the indented, uncached stylesheet (for debugging)
+                instead of the compact one handed to Qt
 
-    def _get_menu_style(self) -> str:
-        """Modern menu styling"""
-        menu_bg = self._palette.surface_1 if self.current_theme == Theme.DARK else "white"
-
-        return f"""
-        QMenuBar {{
-            background-color: {self._palette.background};
-            color: {self._palette.text_primary};
-            border-bottom: 1px solid {self._palette.border};
-            font-size: {self.TYPOGRAPHY['size_sm']};
-            font-weight: {self.TYPOGRAPHY['weight_medium']};
-            padding: {self.SPACING['xs']} 0;
-        }}
-        QMenuBar::item {{
-            padding: {self.SPACING['sm']} {self.SPACING['md']};
-            background-color: transparent;
-            color: {self._palette.text_primary};
-            border-radius: {self.RADIUS['sm']};
-            margin: 0 {self.SPACING['xs']};
-        }}
-        QMenuBar::item:selected {{
-            background-color: {self._palette.surface_1};
-            color: {self._palette.primary_500};
-        }}
-
-        QMenu {{
-            background-color: {menu_bg};
-            color: {self._palette.text_primary};
-            border: 1px solid {self._palette.border};
-            border-radius: {self.RADIUS['md']};
-            padding: {self.SPACING['xs']};
-        }}
-        QMenu::item {{
-            padding: {self.SPACING['sm']} {self.SPACING['xl']} {self.SPACING['sm']} {self.SPACING['lg']};
-            border-radius: {self.RADIUS['sm']};
-            margin: 2px {self.SPACING['xs']};
-        }}
-        QMenu::item:selected {{
-            background-color: {self._palette.primary_50 if self.current_theme == Theme.LIGHT else self._palette.surface_2};
-            color: {self._palette.primary_500 if self.current_theme == Theme.LIGHT else "white"};
-        }}
-        QMenu::separator {{
-            height: 1px;
-            background-color: {self._palette.border};
-            margin: {self.SPACING['xs']} {self.SPACING['md']};
-        }}
+        Returns:
+            Complete QSS stylesheet string
         """
+        if pretty:
+            return _fill_stylesheet(self.current_theme)
+        return _render_stylesheet(self.current_theme)
 
-    def _get_scrollbar_style(self) -> str:
-        """Thinner, modern scrollbar"""
-        return f"""
-        QScrollBar:vertical {{
-            border: none;
-            background: transparent;
-            width: 8px;
-            margin: 0;
-        }}
-        QScrollBar::handle:vertical {{
-            background: {self._palette.neutral_400};
-            border-radius: {self.RADIUS['sm']};
-            min-height: 40px;
-        }}
-        QScrollBar::handle:vertical:hover {{
-            background: {self._palette.neutral_500};
-        }}
-        QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
-            border: none;
-            background: none;
-            height: 0;
-        }}
-        QScrollBar::add-page:vertical, QScrollBar::sub-page:vertical {{
-            background: none;
-        }}
-
-        QScrollBar:horizontal {{
-            border: none;
-            background: transparent;
-            height: 8px;
-            margin: 0;
-        }}
-        QScrollBar::handle:horizontal {{
-            background: {self._palette.neutral_400};
-            border-radius: {self.RADIUS['sm']};
-            min-width: 40px;
-        }}
-        QScrollBar::handle:horizontal:hover {{
-            background: {self._palette.neutral_500};
-        }}
-        QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {{
-            border: none;
-            background: none;
-            width: 0;
-        }}
+    def get_palette(self) -> ColorPalette:
         """
+        Get current color palette
 
-    def _get_splitter_style(self) -> str:
-        """Minimal splitter styling"""
-        return f"""
-        QSplitter::handle {{
-            background-color: {self._palette.border};
-            margin: 0;
-        }}
-        QSplitter::handle:hover {{
-            background-color: {self._palette.primary_500};
-        }}
-        QSplitter::handle:vertical {{
-            height: 2px;
-        }}
-        QSplitter::handle:horizontal {{
-            width: 2px;
-        }}
+        Returns:
+            Current ColorPalette instance
         """
+        return self._palette
 
-    def _get_line_edit_style(self) -> str:
-        """Modern input field styling"""
-        bg_color = self._palette.surface_1 if self.current_theme == Theme.DARK else "white"
-
-        return f"""
-        QLineEdit {{
-            background-color: {bg_color};
-            color: {self._palette.text_primary};
-            border: 2px solid {self._palette.border};
-            border-radius: {self.RADIUS['md']};
-            padding: {self.SPACING['md']} {self.SPACING['base']};
-            font-size: {self.TYPOGRAPHY['size_base']};
-        }}
-        QLineEdit:hover {{
-            border-color: {self._palette.neutral_400};
-        }}
-        QLineEdit:focus {{
-            border-color: {self._palette.border_focus};
-        }}
-        QLineEdit:disabled {{
-            background-color: {self._palette.neutral_100};
-            color: {self._palette.neutral_500};
-        }}
-        """
+    @classmethod
+    def clear_stylesheet_cache(cls):
+        """Drop all cached stylesheets so the next request rebuilds them"""
+        _render_stylesheet.cache_clear()
 
-    def _get_label_style(self) -> str:
-        """Label styling"""
-        return f"""
-        QLabel {{
-            color: {self._palette.text_primary};
-        }}
+    @classmethod
+    def prewarm(cls):
         """
+        Build the stylesheet for every theme up front
 
-    def _get_checkbox_style(self) -> str:
-        """Checkbox styling"""
-        return f"""
-        QCheckBox {{
-            color: {self._palette.text_primary};
-            spacing: {self.SPACING['sm']};
-        }}
-        QCheckBox::indicator {{
-            width: 18px;
-            height: 18px;
-            border-radius: {self.RADIUS['sm']};
-            border: 2px solid {self._palette.border};
-            background-color: {self._palette.background};
-        }}
-        QCheckBox::indicator:hover {{
-            border-color: {self._palette.neutral_400};
-        }}
-        QCheckBox::indicator:checked {{
-            background-color: {self._palette.primary_500};
-            border-color: {self._palette.primary_500};
-        }}
+        Pure Python with no Qt calls, so it is safe to run off the UI thread
+        at startup; the first window show and theme switch then hit the cache.
         """
+        for theme in Theme:
+            _render_stylesheet(theme)
 
-    def _get_progress_bar_style(self) -> str:
-        """Modern, thin progress bar"""
-        return f"""
-        QProgressBar {{
-            border: none;
-            border-radius: {self.RADIUS['full']};
-            background-color: {self._palette.neutral_200};
-            height: 8px;
-            text-align: center;
-        }}
-        QProgressBar::chunk {{
-            background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                stop:0 {self._palette.primary_500},
-                stop:1 {self._palette.primary_300});
-            border-radius: {self.RADIUS['full']};
-        }}
+    @staticmethod
+    def get_available_themes() -> Tuple[Theme, ...]:
         """
+        Get available themes
 
-    def _get_combo_box_style(self) -> str:
-        """Modern combo box styling"""
-        bg_color = self._palette.surface_1 if self.current_theme == Theme.DARK else "white"
-
-        return f"""
-        QComboBox {{
-            background-color: {bg_color};
-            color: {self._palette.text_primary};
-            border: 2px solid {self._palette.border};
-            border-radius: {self.RADIUS['md']};
-            padding: {self.SPACING['md']} {self.SPACING['base']};
-            font-size: {self.TYPOGRAPHY['size_base']};
-            min-height: 20px;
-        }}
-        QComboBox:hover {{
-            border-color: {self._palette.neutral_400};
-        }}
-        QComboBox:focus {{
-            border-color: {self._palette.border_focus};
-        }}
-        QComboBox::drop-down {{
-            border: none;
-            width: 32px;
-        }}
-        QComboBox::down-arrow {{
-            image: none;
-            border: 2px solid {self._palette.neutral_600};
-            width: 8px;
-            height: 8px;
-            border-top: none;
-            border-left: none;
-            margin-right: {self.SPACING['md']};
-        }}
-        QComboBox QAbstractItemView {{
-            background-color: {bg_color};
-            color: {self._palette.text_primary};
-            border: 1px solid {self._palette.border};
-            border-radius: {self.RADIUS['md']};
-            selection-background-color: {self._palette.primary_50 if self.current_theme == Theme.LIGHT else self._palette.surface_2};
-            selection-color: {self._palette.text_primary};
-        }}
-        QComboBox QAbstractItemView::item {{
-            color: {self._palette.text_primary};
-            padding: {self.SPACING['sm']};
-        }}
-        QComboBox QAbstractItemView::item:hover {{
-            background-color: {self._palette.surface_2 if self.current_theme == Theme.DARK else self._palette.neutral_50};
-            color: {self._palette.text_primary};
-        }}
+        Returns:
+            Shared tuple of Theme enum values
         """
+        return _AVAILABLE_THEMES
 
-    def get_palette(self) -> ColorPalette:
-        """
-        Get current color palette
 
-        Returns:
-            Current ColorPalette instance
-        """
-        return self._palette
+def _fill_stylesheet(theme: Theme) -> str:
+    """Render the indented stylesheet template for a theme"""
+    return StyleSheetManager._PALETTE_TEMPLATE.substitute(
+        _palette_params(_PALETTES[theme]), **_THEME_PARAMS[theme]
+    )
 
-    @staticmethod
-    def get_available_themes() -> list:
-        """
-        Get list of available themes
 
-        Returns:
-            List of Theme enum values
-        """
-        return [Theme.LIGHT, Theme.DARK]
+@lru_cache(maxsize=len(Theme))
+def _render_stylesheet(theme: Theme) -> str:
+    """Compact stylesheet for a theme, built once and shared by every manager"""
+    # Interned so every cache and caller shares one string per theme
+    return sys.intern(_minify_qss(_fill_stylesheet(theme)))
@@ -1,10 +1,77 @@
 """
 Drag-and-drop zone widget for audio files with modern 2025 design
 """
+from functools import lru_cache
+from types import MappingProxyType
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QUrl
 from PySide6.QtGui import QDragEnterEvent, QDropEvent, QFont
-from transcription_app.gui.styles.stylesheet_manager import SPACING, RADIUS, TYPOGRAPHY, StyleSheetManager, Theme
+from transcription_app.gui.styles.stylesheet_manager import SPACING_PX, RADIUS, TYPOGRAPHY, StyleSheetManager, Theme
+
+
+@lru_cache(maxsize=len(Theme))
+def _theme_colors(theme: Theme) -> MappingProxyType:
+    """Drop zone colors for a theme (built once per theme, read-only)"""
+    palette = StyleSheetManager(theme)._palette
+    return MappingProxyType({
+        'bg_normal': palette.surface_2,
+        'bg_hover': palette.surface_3,
+        'border_normal': palette.neutral_500,
+        'border_hover': palette.primary_500,
+        'icon_normal': palette.neutral_300,
+        'icon_hover': palette.primary_500,
+        'text_normal': palette.text_primary,
+        'text_hover': palette.primary_50,
+        'subtitle_normal': palette.text_secondary,
+        'subtitle_hover': palette.primary_500,
+    })
+
+
+@lru_cache(maxsize=len(Theme))
+def _stylesheet(theme: Theme) -> str:
+    """
+    Stylesheet for the drop zone and its labels in both states (built on
+    first use of each theme, then shared)
+
+    The hover rules are keyed on the dropState dynamic property, so switching
+    state only repolishes the widgets instead of parsing a new stylesheet.
+    """
+    colors = _theme_colors(theme)
+    return f"""
+        DropZoneWidget {{
+            background-color: {colors['bg_normal']};
+            border: 2px dashed {colors['border_normal']};
+            border-radius: {RADIUS['md']};
+        }}
+        DropZoneWidget[dropState="hover"] {{
+            background-color: {colors['bg_hover']};
+            border: 2px solid {colors['border_hover']};
+        }}
+        QLabel#dropZoneIcon {{
+            color: {colors['icon_normal']};
+        }}
+        QLabel#dropZoneIcon[dropState="hover"] {{
+            color: {colors['icon_hover']};
+        }}
+        QLabel#dropZoneTitle {{
+            color: {colors['text_normal']};
+            font-family: {TYPOGRAPHY['font_primary']};
+            font-size: 16px;
+            font-weight: {TYPOGRAPHY['weight_semibold']};
+        }}
+        QLabel#dropZoneTitle[dropState="hover"] {{
+            color: {colors['text_hover']};
+        }}
+        QLabel#dropZoneSubtitle {{
+            color: {colors['subtitle_normal']};
+            font-family: {TYPOGRAPHY['font_primary']};
+            font-size: 11px;
+            font-weight: {TYPOGRAPHY['weight_regular']};
+        }}
+        QLabel#dropZoneSubtitle[dropState="hover"] {{
+            color: {colors['subtitle_hover']};
+        }}
+    """
 
 
 class DropZoneWidget(QWidget):
@@ -12,9 +79,13 @@ class DropZoneWidget(QWidget):
 
     files_dropped = Signal(list)  # Emits list of file paths
 
+    # Icon font shared by all instances, created on first use (needs a QApplication)
+    _icon_font = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
+        self._drop_state = None  # 'normal' or 'hover' once styled
         # Get theme from parent's style manager if available
         self.current_theme = Theme.DARK  # Default
         if hasattr(parent, 'style_manager'):
@@ -25,41 +96,36 @@ class DropZoneWidget(QWidget):
         """Setup the user interface with compact professional spacing"""
         layout = QVBoxLayout(self)
         # Use compact spacing tokens (base = 12px)
-        spacing = int(SPACING['base'].replace('px', ''))
+        spacing = SPACING_PX['base']
         layout.setContentsMargins(spacing, spacing, spacing, spacing)
-        layout.setSpacing(int(SPACING['xs'].replace('px', '')))  # 2px between elements - very compact
+        layout.setSpacing(SPACING_PX['xs'])  # 2px between elements - very compact
 
         # Icon label - smaller, cleaner
         self.icon_label = QLabel("📁")
+        self.icon_label.setObjectName("dropZoneIcon")
         self.icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        icon_font = QFont()
-        icon_font.setPointSize(20)  # Much smaller for compact design
-        self.icon_label.setFont(icon_font)
+        if DropZoneWidget._icon_font is None:
+            DropZoneWidget._icon_font = QFont()
+            DropZoneWidget._icon_font.setPointSize(20)  # Much smaller for compact design
+        self.icon_label.setFont(DropZoneWidget._icon_font)
         layout.addWidget(self.icon_label)
 
         # Main text label - compact and readable
         self.label = QLabel("Drop Audio Files Here")
+        self.label.setObjectName("dropZoneTitle")
         self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.label.setWordWrap(True)
-        self.label.setStyleSheet(f"""
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: 16px;
-            font-weight: {TYPOGRAPHY['weight_semibold']};
-        """)
         layout.addWidget(self.label)
 
         # Subtitle label - very compact
         self.subtitle = QLabel("MP3, WAV, M4A, FLAC, MP4...")
+        self.subtitle.setObjectName("dropZoneSubtitle")
         self.subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.subtitle.setWordWrap(True)
-        self.subtitle.setStyleSheet(f"""
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: 11px;
-            font-weight: {TYPOGRAPHY['weight_regular']};
-        """)
         layout.addWidget(self.subtitle)
 
         # Apply initial styling
+        self.setStyleSheet(_stylesheet(self.current_theme))
         self.apply_normal_style()
 
         # Set minimum size - very compact
@@ -67,72 +133,31 @@ class DropZoneWidget(QWidget):
 
     def get_theme_colors(self):
         """Get colors for current theme"""
-        sm = StyleSheetManager(self.current_theme)
-        palette = sm._palette
-        return {
-            'bg_normal': palette.surface_2,
-            'bg_hover': palette.surface_3,
-            'border_normal': palette.neutral_500,
-            'border_hover': palette.primary_500,
-            'icon_normal': palette.neutral_300,
-            'icon_hover': palette.primary_500,
-            'text_normal': palette.text_primary,
-            'text_hover': palette.primary_50,
-            'subtitle_normal': palette.text_secondary,
-            'subtitle_hover': palette.primary_500,
-        }
+        return _theme_colors(self.current_theme)
 
     def apply_normal_style(self):
         """Apply normal state styling - theme aware"""
-        colors = self.get_theme_colors()
-        self.setStyleSheet(f"""
-            DropZoneWidget {{
-                background-color: {colors['bg_normal']};
-                border: 2px dashed {colors['border_normal']};
-                border-radius: {RADIUS['md']};
-            }}
-        """)
-        self.icon_label.setStyleSheet(f"color: {colors['icon_normal']};")
-        self.label.setStyleSheet(f"""
-            color: {colors['text_normal']};
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: 16px;
-            font-weight: {TYPOGRAPHY['weight_semibold']};
-        """)
-        self.subtitle.setStyleSheet(f"""
-            color: {colors['subtitle_normal']};
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: 11px;
-            font-weight: {TYPOGRAPHY['weight_regular']};
-        """)
+        self._set_drop_state('normal')
 
     def apply_hover_style(self):
         """Apply hover state styling - theme aware"""
-        colors = self.get_theme_colors()
-        self.setStyleSheet(f"""
-            DropZoneWidget {{
-                background-color: {colors['bg_hover']};
-                border: 2px solid {colors['border_hover']};
-                border-radius: {RADIUS['md']};
-            }}
-        """)
-        self.icon_label.setStyleSheet(f"color: {colors['icon_hover']};")
-        self.label.setStyleSheet(f"""
-            color: {colors['text_hover']};
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: 16px;
-            font-weight: {TYPOGRAPHY['weight_semibold']};
-        """)
-        self.subtitle.setStyleSheet(f"""
-            color: {colors['subtitle_hover']};
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: 11px;
-            font-weight: {TYPOGRAPHY['weight_regular']};
-        """)
+        self._set_drop_state('hover')
+
+    def _set_drop_state(self, state: str):
+        """Switch the dropState property and repolish the widget and its labels"""
+        if state == self._drop_state:
+            return
+        self._drop_state = state
+        for widget in (self, self.icon_label, self.label, self.subtitle):
+            widget.setProperty('dropState', state)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
 
     def update_theme(self, theme: Theme):
         """Update widget theme"""
         self.current_theme = theme
+        self.setStyleSheet(_stylesheet(theme))
         self.apply_normal_style()
 
     def dragEnterEvent(self, event: QDragEnterEvent):
@@ -147,7 +172,8 @@ class DropZoneWidget(QWidget):
 
     def dropEvent(self, event: QDropEvent):
         """Handle file drop event"""
-        files = [url.toLocalFile() for url in event.mimeData().urls()]
+        # Non-local URLs map to "" and are dropped
+        files = [path for path in map(QUrl.toLocalFile, event.mimeData().urls()) if path]
         self.apply_normal_style()
 
         # Emit signal with file paths
@@ -1,56 +1,83 @@
 """
 Enhanced file queue widget with modern card styling and controls
 """
-from pathlib import Path
+import os
+from functools import lru_cache
+from types import MappingProxyType
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QPushButton, QProgressBar, QScrollArea, QFrame
 )
-from PySide6.QtCore import Qt, Signal, QPropertyAnimation, QEasingCurve
+from PySide6.QtCore import (
+    Qt, Signal, Slot, QObject, QRunnable, QThreadPool, QTimer, QPropertyAnimation, QEasingCurve
+)
 from PySide6.QtGui import QFont
 from transcription_app.gui.styles import AnimationHelper
-from transcription_app.gui.styles.stylesheet_manager import SPACING, RADIUS, TYPOGRAPHY, StyleSheetManager, Theme
+from transcription_app.gui.styles.stylesheet_manager import SPACING, SPACING_PX, RADIUS, TYPOGRAPHY, StyleSheetManager, Theme
 
 
-class FileQueueItem(QFrame):
-    """Individual file item with progress bar and controls"""
+class _FileSizeSignals(QObject):
+    """Delivers file sizes from the pool thread to the GUI thread"""
 
-    cancel_clicked = Signal(str)  # file_id
-    remove_clicked = Signal(str)  # file_id
+    sizes_ready = Signal(list)  # [(file_id, size in bytes or None), ...]
+
+
+class _FileSizeTask(QRunnable):
+    """Stats a batch of queued files off the GUI thread"""
+
+    def __init__(self, files, signals: _FileSizeSignals):
+        super().__init__()
+        self.files = files  # [(file_id, file_path), ...]
+        self.signals = signals
+
+    def run(self):
+        sizes = []
+        for file_id, file_path in self.files:
+            try:
+                size = os.stat(file_path).st_size
+            except OSError:
+                size = None
+            sizes.append((file_id, size))
+        # One cross-thread emit per batch rather than per file
+        self.signals.sizes_ready.emit(sizes)
+
+
+# (divisor, unit) for each power of 1024 used by FileQueueItem._format_size
+_SIZE_UNITS = tuple(
+    (1024.0 ** power, unit) for power, unit in enumerate(('B', 'KB', 'MB', 'GB', 'TB'))
+)
 
-    def __init__(self, file_id: str, file_path: str, parent=None):
-        super().__init__(parent)
-        self.file_id = file_id
-        self.file_path = file_path
-        self._progress_animation = None
-        self.current_theme = Theme.DARK  # Default
-        if hasattr(parent, 'current_theme'):
-            self.current_theme = parent.current_theme
-        self.setup_ui()
 
-    def _get_colors(self):
-        """Get theme-aware colors"""
-        sm = StyleSheetManager(self.current_theme)
-        p = sm._palette
-        return {
-            'card_bg': p.surface_1,
-            'card_hover': p.surface_2,
-            'border': p.neutral_600,
-            'border_hover': p.primary_500,
-            'text_primary': p.text_primary,
-            'text_secondary': p.text_secondary,
-            'text_muted': p.neutral_300,
-            'progress_bg': p.neutral_600,
-            'progress_fill': p.primary_500,
-            'progress_fill_end': p.primary_300,
-            'success': p.success_main,
-            'error': p.error_main,
-        }
-
-    def _apply_card_style(self):
-        """Apply card styling"""
-        c = self._get_colors()
-        self.setStyleSheet(f"""
+@lru_cache(maxsize=len(Theme))
+def _item_colors(theme: Theme) -> MappingProxyType:
+    """Theme-aware colors for a queue item (built once per theme, read-only)"""
+    p = StyleSheetManager(theme)._palette
+    return MappingProxyType({
+        'card_bg': p.surface_1,
+        'card_hover': p.surface_2,
+        'border': p.neutral_600,
+        'border_hover': p.primary_500,
+        'text_primary': p.text_primary,
+        'text_secondary': p.text_secondary,
+        'text_muted': p.neutral_300,
+        'progress_bg': p.neutral_600,
+        'progress_fill': p.primary_500,
+        'progress_fill_end': p.primary_300,
+        'success': p.success_main,
+        'error': p.error_main,
+    })
+
+
+def _build_item_stylesheet(theme: Theme) -> str:
+    """
+    Stylesheet for every queue item, set once on the queue container
+
+    Styles the card, its labels, button and progress bar through objectName
+    and type selectors. Success/error colors are keyed on the state dynamic
+    property of the status label and the progress bar.
+    """
+    c = _item_colors(theme)
+    return f"""
             FileQueueItem {{
                 background-color: {c['card_bg']};
                 border: 2px solid {c['border']};
@@ -62,41 +89,39 @@ class FileQueueItem(QFrame):
                 border-color: {c['border_hover']};
                 background-color: {c['card_hover']};
             }}
-        """)
-
-    def _apply_label_styles(self):
-        """Apply styles to all labels"""
-        c = self._get_colors()
-        self.name_label.setStyleSheet(f"""
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: {TYPOGRAPHY['size_base']};
-            font-weight: {TYPOGRAPHY['weight_semibold']};
-            color: {c['text_primary']};
-        """)
-        self.status_label.setStyleSheet(f"""
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: {TYPOGRAPHY['size_sm']};
-            font-weight: {TYPOGRAPHY['weight_regular']};
-            color: {c['text_secondary']};
-        """)
-        self.size_label.setStyleSheet(f"""
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: {TYPOGRAPHY['size_xs']};
-            font-weight: {TYPOGRAPHY['weight_regular']};
-            color: {c['text_muted']};
-        """)
-        self.percent_label.setStyleSheet(f"""
-            font-family: {TYPOGRAPHY['font_mono']};
-            font-size: {TYPOGRAPHY['size_xs']};
-            font-weight: {TYPOGRAPHY['weight_medium']};
-            color: {c['progress_fill']};
-        """)
-
-    def _apply_button_style(self):
-        """Apply cancel button style"""
-        c = self._get_colors()
-        self.cancel_btn.setStyleSheet(f"""
-            QPushButton {{
+            QLabel#queueItemName {{
+                font-family: {TYPOGRAPHY['font_primary']};
+                font-size: {TYPOGRAPHY['size_base']};
+                font-weight: {TYPOGRAPHY['weight_semibold']};
+                color: {c['text_primary']};
+            }}
+            QLabel#queueItemStatus {{
+                font-family: {TYPOGRAPHY['font_primary']};
+                font-size: {TYPOGRAPHY['size_sm']};
+                font-weight: {TYPOGRAPHY['weight_regular']};
+                color: {c['text_secondary']};
+            }}
+            QLabel#queueItemStatus[state="complete"] {{
+                font-weight: {TYPOGRAPHY['weight_semibold']};
+                color: {c['success']};
+            }}
+            QLabel#queueItemStatus[state="error"] {{
+                font-weight: {TYPOGRAPHY['weight_semibold']};
+                color: {c['error']};
+            }}
+            QLabel#queueItemSize {{
+                font-family: {TYPOGRAPHY['font_primary']};
+                font-size: {TYPOGRAPHY['size_xs']};
+                font-weight: {TYPOGRAPHY['weight_regular']};
+                color: {c['text_muted']};
+            }}
+            QLabel#queueItemPercent {{
+                font-family: {TYPOGRAPHY['font_mono']};
+                font-size: {TYPOGRAPHY['size_xs']};
+                font-weight: {TYPOGRAPHY['weight_medium']};
+                color: {c['progress_fill']};
+            }}
+            QPushButton#queueItemCancel {{
                 background-color: transparent;
                 border: none;
                 border-radius: 12px;
@@ -104,16 +129,10 @@ class FileQueueItem(QFrame):
                 font-size: 14px;
                 font-weight: bold;
             }}
-            QPushButton:hover {{
+            QPushButton#queueItemCancel:hover {{
                 background-color: {c['error']};
                 color: white;
             }}
-        """)
-
-    def _apply_progress_style(self):
-        """Apply progress bar style"""
-        c = self._get_colors()
-        self.progress_bar.setStyleSheet(f"""
             QProgressBar {{
                 border: none;
                 border-radius: {RADIUS['sm']};
@@ -124,7 +143,74 @@ class FileQueueItem(QFrame):
                     stop:0 {c['progress_fill']}, stop:1 {c['progress_fill_end']});
                 border-radius: {RADIUS['sm']};
             }}
-        """)
+            QProgressBar[state="error"]::chunk {{
+                background: {c['error']};
+            }}
+        """
+
+
+@lru_cache(maxsize=len(Theme))
+def _queue_styles(theme: Theme) -> MappingProxyType:
+    """
+    Stylesheets for the queue widget's own chrome, keyed by role (built on
+    first use of each theme, then shared; read-only)
+
+    'container' also carries the rules for every item in the queue, so they
+    are parsed once per container rather than once per item.
+    """
+    p = StyleSheetManager(theme)._palette
+    return MappingProxyType({
+        'widget': f"""
+            QWidget {{
+                background-color: {p.background};
+            }}
+        """,
+        'header': f"background-color: {p.background};",
+        'title': f"""
+            font-family: {TYPOGRAPHY['font_primary']};
+            font-size: {TYPOGRAPHY['size_lg']};
+            font-weight: {TYPOGRAPHY['weight_semibold']};
+            color: {p.text_primary};
+        """,
+        'count': f"""
+            font-family: {TYPOGRAPHY['font_primary']};
+            font-size: {TYPOGRAPHY['size_sm']};
+            font-weight: {TYPOGRAPHY['weight_regular']};
+            color: {p.text_secondary};
+        """,
+        'scroll': f"""
+            QScrollArea {{
+                background-color: {p.background};
+                border: none;
+            }}
+        """,
+        'container': f"""
+            QWidget#fileQueueContainer {{
+                background-color: {p.background};
+            }}
+        """ + _build_item_stylesheet(theme),
+    })
+
+
+class FileQueueItem(QFrame):
+    """Individual file item with progress bar and controls"""
+
+    cancel_clicked = Signal(str)  # file_id
+    remove_clicked = Signal(str)  # file_id
+
+    # Progress changes smaller than this (in percent) are applied without animation
+    MIN_ANIMATED_STEP = 3
+
+    def __init__(self, file_id: str, file_path: str, parent=None):
+        super().__init__(parent)
+        self.file_id = file_id
+        self.file_path = file_path
+        self.current_theme = Theme.DARK  # Default
+        if hasattr(parent, 'current_theme'):
+            self.current_theme = parent.current_theme
+        self._visual_state = 'running'  # Status styling applied: running, complete or error
+        self._last_progress = None  # (percentage, status) currently shown
+        self.setup_ui()
 
     def setup_ui(self):
         """Setup the UI for this file item - theme aware"""
@@ -132,12 +218,12 @@ class FileQueueItem(QFrame):
 
         layout = QVBoxLayout(self)
         # Use design tokens for spacing
-        layout.setSpacing(int(SPACING['sm'].replace('px', '')))
+        layout.setSpacing(SPACING_PX['sm'])
         layout.setContentsMargins(
-            int(SPACING['md'].replace('px', '')),
-            int(SPACING['md'].replace('px', '')),
-            int(SPACING['md'].replace('px', '')),
-            int(SPACING['md'].replace('px', ''))
+            SPACING_PX['md'],
+            SPACING_PX['md'],
+            SPACING_PX['md'],
+            SPACING_PX['md']
         )
 
         # Top row: filename and controls
@@ -145,19 +231,22 @@ class FileQueueItem(QFrame):
 
         # File icon and name
         self.name_label = QLabel(self.file_id)
+        self.name_label.setObjectName("queueItemName")
         top_row.addWidget(self.name_label)
 
         top_row.addStretch()
 
         # Status label
         self.status_label = QLabel("Waiting...")
+        self.status_label.setObjectName("queueItemStatus")
         top_row.addWidget(self.status_label)
 
         # Cancel button
         self.cancel_btn = QPushButton("✕")
+        self.cancel_btn.setObjectName("queueItemCancel")
         self.cancel_btn.setFixedSize(24, 24)
         self.cancel_btn.setToolTip("Cancel transcription")
-        self.cancel_btn.clicked.connect(lambda: self.cancel_clicked.emit(self.file_id))
+        self.cancel_btn.clicked.connect(self._on_cancel_clicked)
         top_row.addWidget(self.cancel_btn)
 
         layout.addLayout(top_row)
@@ -171,16 +260,17 @@ class FileQueueItem(QFrame):
         self.progress_bar.setFixedHeight(8)
         layout.addWidget(self.progress_bar)
 
+        # Single animation reused for every progress change
+        self._progress_animation = QPropertyAnimation(self.progress_bar, b"value", self.progress_bar)
+        self._progress_animation.setDuration(AnimationHelper.DURATION_NORMAL)
+        self._progress_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+
         # Bottom row: file info
         info_row = QHBoxLayout()
 
-        # File size
-        try:
-            file_size = Path(self.file_path).stat().st_size
-            size_str = self._format_size(file_size)
-            self.size_label = QLabel(size_str)
-        except:
-            self.size_label = QLabel("Unknown size")
+        # File size (filled in by set_file_size once the file has been stat'ed)
+        self.size_label = QLabel("…")
+        self.size_label.setObjectName("queueItemSize")
 
         info_row.addWidget(self.size_label)
 
@@ -188,156 +278,168 @@ class FileQueueItem(QFrame):
 
         # Percentage label
         self.percent_label = QLabel("0%")
+        self.percent_label.setObjectName("queueItemPercent")
         info_row.addWidget(self.percent_label)
 
         layout.addLayout(info_row)
 
-        # Apply all theme-aware styles
-        self._apply_card_style()
-        self._apply_label_styles()
-        self._apply_button_style()
-        self._apply_progress_style()
+        # Styling comes from the queue container's stylesheet
+
+    @Slot()
+    def _on_cancel_clicked(self):
+        """Forward the cancel button as cancel_clicked for this file"""
+        self.cancel_clicked.emit(self.file_id)
 
+    @Slot()
+    def _on_remove_clicked(self):
+        """Forward the remove button (after an error) as remove_clicked"""
+        self.remove_clicked.emit(self.file_id)
+
+    @Slot(int, str)
     def update_progress(self, percentage: int, status: str):
         """Update progress bar and status with smooth animation"""
-        # Animate progress bar changes
+        # Backends often repeat the same update; nothing would change
+        progress = (percentage, status)
+        if progress == self._last_progress:
+            return
+        self._last_progress = progress
+        self._show_progress(percentage, status, self._visual_state_for(percentage, status))
+
+    def _show_progress(self, percentage: int, status: str, state: str):
+        """Apply a progress update to the bar, labels and status colors"""
+        # Animate progress bar changes from wherever the bar is now; small
+        # steps, terminal states and items that are not on screen (hidden or
+        # scrolled out of view) are set directly
         current_value = self.progress_bar.value()
         if percentage != current_value:
-            # Stop any existing animation
-            if self._progress_animation:
-                self._progress_animation.stop()
-
-            # Create smooth progress animation
-            self._progress_animation = QPropertyAnimation(self.progress_bar, b"value")
-            self._progress_animation.setDuration(AnimationHelper.DURATION_NORMAL)
-            self._progress_animation.setStartValue(current_value)
-            self._progress_animation.setEndValue(percentage)
-            self._progress_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-            self._progress_animation.start()
+            self._progress_animation.stop()
+            animate = (
+                state == 'running'
+                and abs(percentage - current_value) >= self.MIN_ANIMATED_STEP
+                and self.isVisible()
+                and not self.visibleRegion().isEmpty()
+            )
+            if not animate:
+                self.progress_bar.setValue(percentage)
+            else:
+                self._progress_animation.setStartValue(current_value)
+                self._progress_animation.setEndValue(percentage)
+                self._progress_animation.start()
 
         self.status_label.setText(status)
         self.percent_label.setText(f"{percentage}%")
 
-        # Change colors based on status using semantic colors
-        c = self._get_colors()
-        if percentage == 100:
-            self.status_label.setStyleSheet(f"""
-                font-family: {TYPOGRAPHY['font_primary']};
-                font-size: {TYPOGRAPHY['size_sm']};
-                font-weight: {TYPOGRAPHY['weight_semibold']};
-                color: {c['success']};
-            """)
+        # Change colors based on status using semantic colors, only when
+        # entering a new terminal state
+        if state == 'running' or state == self._visual_state:
+            return
+        self._visual_state = state
+        for widget in (self.status_label, self.progress_bar):
+            widget.setProperty('state', state)
+            style = widget.style()
+            style.unpolish(widget)
+            style.polish(widget)
+        if state == 'complete':
             self.cancel_btn.setVisible(False)
-        elif "error" in status.lower():
-            self.status_label.setStyleSheet(f"""
-                font-family: {TYPOGRAPHY['font_primary']};
-                font-size: {TYPOGRAPHY['size_sm']};
-                font-weight: {TYPOGRAPHY['weight_semibold']};
-                color: {c['error']};
-            """)
-            self.progress_bar.setStyleSheet(f"""
-                QProgressBar {{
-                    border: none;
-                    border-radius: {RADIUS['sm']};
-                    background-color: {c['progress_bg']};
-                }}
-                QProgressBar::chunk {{
-                    background-color: {c['error']};
-                    border-radius: {RADIUS['sm']};
-                }}
-            """)
 
+    def set_file_size(self, size_bytes):
+        """Show the file size, or "Unknown size" if it could not be read (None)"""
+        if size_bytes is None:
+            self.size_label.setText("Unknown size")
+        else:
+            self.size_label.setText(self._format_size(size_bytes))
+
+    @Slot()
     def mark_complete(self):
         """Mark as complete"""
         self.update_progress(100, "Complete!")
         self.cancel_btn.setVisible(False)
 
+    @Slot(str)
     def mark_error(self, error: str):
         """Mark as error"""
         self.update_progress(0, f"Error: {error[:50]}")
         self.cancel_btn.setText("✕")
         self.cancel_btn.setToolTip("Remove from list")
         self.cancel_btn.clicked.disconnect()
-        self.cancel_btn.clicked.connect(lambda: self.remove_clicked.emit(self.file_id))
+        self.cancel_btn.clicked.connect(self._on_remove_clicked)
 
     def update_theme(self, theme: Theme):
-        """Update widget theme"""
+        """Update widget theme (colors follow the queue container's stylesheet)"""
         self.current_theme = theme
-        self._apply_card_style()
-        self._apply_label_styles()
-        self._apply_button_style()
-        self._apply_progress_style()
+
+    @staticmethod
+    def _visual_state_for(percentage: int, status: str) -> str:
+        """Classify a progress update as 'complete', 'error' or 'running'"""
+        if percentage == 100:
+            return 'complete'
+        if "error" in status.lower():
+            return 'error'
+        return 'running'
 
     @staticmethod
     def _format_size(size_bytes: int) -> str:
         """Format file size in human-readable format"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} TB"
+        # Units step by 2**10, so the bit length selects the unit directly
+        index = min(max(size_bytes.bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        divisor, unit = _SIZE_UNITS[index]
+        return f"{size_bytes / divisor:.1f} {unit}"
 
 
 class FileQueueWidget(QWidget):
-    """Widget to display file queue with progress"""
+    """
+    Widget to display file queue with progress
+
+    Like any widget it must only be updated from the GUI thread. Signals
+    from worker threads connected to update_progress, mark_complete or
+    mark_error are queued automatically; connect all three the same way so
+    they keep their order.
+    """
 
     cancel_file = Signal(str)  # file_id
     remove_file = Signal(str)  # file_id
 
+    # Interval (ms) at which coalesced progress updates are shown (~30 Hz)
+    PROGRESS_FLUSH_INTERVAL = 33
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.file_items = {}  # file_id -> FileQueueItem
+        # Latest progress per file waiting to be shown; updates arriving
+        # between two flushes are coalesced into one per file
+        self._pending_progress = {}  # file_id -> (percentage, status)
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(self.PROGRESS_FLUSH_INTERVAL)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        # Files waiting to be stat'ed, sent to the thread pool in one batch
+        self._pending_sizes = []
+        self._size_signals = _FileSizeSignals()
+        # Emitted from a pool thread, so always delivered through the event loop
+        self._size_signals.sizes_ready.connect(
+            self._on_file_sizes, Qt.ConnectionType.QueuedConnection
+        )
         self.current_theme = Theme.DARK  # Default
         if hasattr(parent, 'style_manager'):
             self.current_theme = parent.style_manager.current_theme
         self.setup_ui()
 
-    def _get_colors(self):
-        """Get theme-aware colors"""
-        sm = StyleSheetManager(self.current_theme)
-        p = sm._palette
-        return {
-            'bg': p.background,
-            'text_primary': p.text_primary,
-            'text_secondary': p.text_secondary,
-        }
-
     def _apply_widget_style(self):
         """Apply theme-aware widget style"""
-        c = self._get_colors()
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {c['bg']};
-            }}
-        """)
+        self.setStyleSheet(_queue_styles(self.current_theme)['widget'])
 
     def _apply_header_style(self):
         """Apply header styling"""
-        c = self._get_colors()
-        self.header.setStyleSheet(f"background-color: {c['bg']};")
-        self.title.setStyleSheet(f"""
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: {TYPOGRAPHY['size_lg']};
-            font-weight: {TYPOGRAPHY['weight_semibold']};
-            color: {c['text_primary']};
-        """)
-        self.count_label.setStyleSheet(f"""
-            font-family: {TYPOGRAPHY['font_primary']};
-            font-size: {TYPOGRAPHY['size_sm']};
-            font-weight: {TYPOGRAPHY['weight_regular']};
-            color: {c['text_secondary']};
-        """)
+        styles = _queue_styles(self.current_theme)
+        self.header.setStyleSheet(styles['header'])
+        self.title.setStyleSheet(styles['title'])
+        self.count_label.setStyleSheet(styles['count'])
 
     def _apply_scroll_style(self):
         """Apply scroll area styling"""
-        c = self._get_colors()
-        self.scroll.setStyleSheet(f"""
-            QScrollArea {{
-                background-color: {c['bg']};
-                border: none;
-            }}
-        """)
-        self.container.setStyleSheet(f"background-color: {c['bg']};")
+        styles = _queue_styles(self.current_theme)
+        self.scroll.setStyleSheet(styles['scroll'])
+        self.container.setStyleSheet(styles['container'])
 
     def setup_ui(self):
         """Setup the UI"""
@@ -348,7 +450,7 @@ class FileQueueWidget(QWidget):
         self.header = QWidget()
         header_layout = QHBoxLayout(self.header)
         # Compact header padding (4px = sm)
-        padding = int(SPACING['sm'].replace('px', ''))
+        padding = SPACING_PX['sm']
         header_layout.setContentsMargins(padding * 2, padding, padding * 2, padding)
 
         self.title = QLabel("File Queue")
@@ -366,14 +468,8 @@ class FileQueueWidget(QWidget):
         self.scroll.setWidgetResizable(True)
         self.scroll.setFrameShape(QFrame.Shape.NoFrame)
 
-        # Container for file items - compact spacing
-        self.container = QWidget()
-        self.container_layout = QVBoxLayout(self.container)
-        # Use xs spacing (2px) for very compact layout
-        compact_spacing = int(SPACING['xs'].replace('px', ''))
-        self.container_layout.setSpacing(compact_spacing)
-        self.container_layout.setContentsMargins(compact_spacing, compact_spacing, compact_spacing, compact_spacing)
-        self.container_layout.addStretch()
+        # Container for file items
+        self._create_container()
 
         self.scroll.setWidget(self.container)
         layout.addWidget(self.scroll)
@@ -383,14 +479,49 @@ class FileQueueWidget(QWidget):
         self._apply_header_style()
         self._apply_scroll_style()
 
+    def _create_container(self):
+        """Create an empty container for file items - compact spacing"""
+        self.container = QWidget()
+        self.container.setObjectName("fileQueueContainer")
+        self.container_layout = QVBoxLayout(self.container)
+        # Use xs spacing (2px) for very compact layout
+        compact_spacing = SPACING_PX['xs']
+        self.container_layout.setSpacing(compact_spacing)
+        self.container_layout.setContentsMargins(compact_spacing, compact_spacing, compact_spacing, compact_spacing)
+        self.container_layout.addStretch()
+
     def add_file(self, file_id: str, file_path: str):
         """Add a file to the queue"""
+        if self._add_item(file_id, file_path):
+            self._update_count()
+
+    def add_files(self, files):
+        """
+        Add several files to the queue in one batch
+
+        Repaints are suspended while the items are inserted and the count
+        label is updated once at the end.
+
+        Args:
+            files: Iterable of (file_id, file_path) pairs
+        """
+        self.container.setUpdatesEnabled(False)
+        try:
+            for file_id, file_path in files:
+                self._add_item(file_id, file_path)
+        finally:
+            self.container.setUpdatesEnabled(True)
+        self._update_count()
+
+    def _add_item(self, file_id: str, file_path: str) -> bool:
+        """Create and insert the item for a file; False if it is already queued"""
         if file_id in self.file_items:
-            return
+            return False
 
         item = FileQueueItem(file_id, file_path)
-        item.cancel_clicked.connect(self.cancel_file.emit)
-        item.remove_clicked.connect(self._remove_item)
+        # Items live in this widget's thread; call straight through
+        item.cancel_clicked.connect(self.cancel_file.emit, Qt.ConnectionType.DirectConnection)
+        item.remove_clicked.connect(self._remove_item, Qt.ConnectionType.DirectConnection)
 
         # Insert before stretch
         self.container_layout.insertWidget(
@@ -399,33 +530,106 @@ class FileQueueWidget(QWidget):
         )
 
         self.file_items[file_id] = item
-        self._update_count()
 
+        # Stat the file off the GUI thread; files added in the same event
+        # loop pass (e.g. a multi-file drop) share one task
+        if not self._pending_sizes:
+            QTimer.singleShot(0, self._start_size_task)
+        self._pending_sizes.append((file_id, file_path))
+        return True
+
+    @Slot()
+    def _start_size_task(self):
+        """Hand the pending files to a pool thread for stat()"""
+        files, self._pending_sizes = self._pending_sizes, []
+        QThreadPool.globalInstance().start(_FileSizeTask(files, self._size_signals))
+
+    @Slot(list)
+    def _on_file_sizes(self, sizes: list):
+        """Show file sizes computed by the pool thread"""
+        for file_id, size_bytes in sizes:
+            item = self.file_items.get(file_id)
+            if item is not None:  # May have been removed meanwhile
+                item.set_file_size(size_bytes)
+
+    @Slot(str, int, str)
     def update_progress(self, file_id: str, percentage: int, status: str):
-        """Update progress for a file"""
-        if file_id in self.file_items:
+        """
+        Update progress for a file
+
+        Progress is shown on the next flush, with only the latest update per
+        file kept; completion and errors are shown at once.
+        """
+        if file_id not in self.file_items:
+            return
+        if FileQueueItem._visual_state_for(percentage, status) != 'running':
+            self._pending_progress.pop(file_id, None)
             self.file_items[file_id].update_progress(percentage, status)
+            return
+
+        self._pending_progress[file_id] = (percentage, status)
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    @Slot()
+    def _flush_progress(self):
+        """Show the latest coalesced progress update of each file"""
+        pending, self._pending_progress = self._pending_progress, {}
+        for file_id, (percentage, status) in pending.items():
+            item = self.file_items.get(file_id)
+            if item is not None:  # May have been removed meanwhile
+                item.update_progress(percentage, status)
 
+    @Slot(str)
     def mark_complete(self, file_id: str):
         """Mark file as complete"""
         if file_id in self.file_items:
+            self._pending_progress.pop(file_id, None)
             self.file_items[file_id].mark_complete()
 
+    @Slot(str, str)
     def mark_error(self, file_id: str, error: str):
         """Mark file as error"""
         if file_id in self.file_items:
+            self._pending_progress.pop(file_id, None)
             self.file_items[file_id].mark_error(error)
 
+    @Slot(str)
     def _remove_item(self, file_id: str):
         """Remove item from queue"""
-        if file_id in self.file_items:
-            item = self.file_items[file_id]
-            self.container_layout.removeWidget(item)
-            item.deleteLater()
-            del self.file_items[file_id]
-            self._update_count()
+        self.remove_many((file_id,))
+
+    def remove_many(self, file_ids):
+        """
+        Remove several files from the queue in one batch
+
+        Repaints are suspended while the items are taken out, the count label
+        is updated once, and remove_file is emitted for each removed file.
+
+        Args:
+            file_ids: Iterable of file ids; ids not in the queue are ignored
+        """
+        removed = []
+        self.container.setUpdatesEnabled(False)
+        try:
+            for file_id in file_ids:
+                item = self.file_items.pop(file_id, None)
+                if item is None:
+                    continue
+                self._pending_progress.pop(file_id, None)
+                self.container_layout.removeWidget(item)
+                item.deleteLater()
+                removed.append(file_id)
+        finally:
+            self.container.setUpdatesEnabled(True)
+        if not removed:
+            return
+
+        self._update_count()
+        for file_id in removed:
             self.remove_file.emit(file_id)
 
+    @Slot()
     def _update_count(self):
         """Update file count label"""
         count = len(self.file_items)
@@ -441,7 +645,22 @@ class FileQueueWidget(QWidget):
         for item in self.file_items.values():
             item.update_theme(theme)
 
+    @Slot()
     def clear(self):
         """Clear all items"""
-        for file_id in list(self.file_items.keys()):
-            self._remove_item(file_id)
+        if not self.file_items:
+            return
+        items, self.file_items = self.file_items, {}
+        self._pending_progress.clear()
+
+        # Swap in a fresh empty container and delete the old one together
+        # with all of its items, rather than taking items out one at a time
+        old_container = self.scroll.takeWidget()
+        self._create_container()
+        self.container.setStyleSheet(_queue_styles(self.current_theme)['container'])
+        self.scroll.setWidget(self.container)
+        old_container.deleteLater()
+        self._update_count()
+
+        for file_id in items:
+            self.remove_file.emit(file_id)
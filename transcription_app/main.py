@@ -3,6 +3,7 @@ CloudCall Transcription Application
 Main entry point with proper initialization
 """
 import sys
+import threading
 import warnings
 import shutil
 from pathlib import Path
@@ -13,6 +14,7 @@ from PySide6.QtCore import Qt
 warnings.filterwarnings('ignore', category=UserWarning, message='.*pkg_resources is deprecated.*')
 
 from transcription_app.gui.main_window import MainWindow
+from transcription_app.gui.styles.stylesheet_manager import StyleSheetManager
 from transcription_app.viewmodels.transcription_vm import TranscriptionViewModel
 from transcription_app.core.transcription_engine import TranscriptionEngine
 from transcription_app.core.audio_recorder import AudioRecorder
@@ -131,6 +133,9 @@ def main():
     app.setApplicationName("CloudCall Transcription")
     app.setOrganizationName("CloudCall")
 
+    # Build theme stylesheets while config, logging and services load
+    threading.Thread(target=StyleSheetManager.prewarm, daemon=True).start()
+
     # Load configuration
     config = get_config()
 